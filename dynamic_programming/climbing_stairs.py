@@ -1,5 +1,12 @@
 # dynamic_programming/climbing_stairs.py
 
+import os
+import sys
+
+# `lru_memoize` lives next to `LRUCache` in the linked_lists folder.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "linked_lists"))
+from lru_memoize import lru_memoize
+
 # --- 1. Naive Recursive Solution (Exponential Time) ---
 
 def climb_stairs_naive(n: int) -> int:
@@ -35,6 +42,24 @@ def climb_stairs_memo(n: int) -> int:
     
     return solve(n)
 
+# --- 2b. Top-Down with a Shared, Bounded LRU Memo ---
+
+@lru_memoize(capacity=256)
+def climb_stairs_lru(n: int) -> int:
+    """
+    The same top-down recurrence, but memoized by the `lru_memoize`
+    decorator instead of a `memo` dict built and thrown away on every call.
+    Results survive between calls, the memo never holds more than
+    `capacity` entries, and `climb_stairs_lru.cache_info()` reports how often
+    the cache is actually hit.
+
+    Time Complexity: O(n) for the first call, O(1) for repeated calls.
+    Space Complexity: O(min(n, capacity)) for the cache, O(n) recursion stack.
+    """
+    if n <= 2:
+        return n
+    return climb_stairs_lru(n - 1) + climb_stairs_lru(n - 2)
+
 # --- 3. Bottom-Up Dynamic Programming with Tabulation ---
 
 def climb_stairs_tabulation(n: int) -> int:
@@ -88,6 +113,7 @@ def main():
     
     # print(f"Naive recursive solution: {climb_stairs_naive(35)}") # Very slow!
     print(f"Top-Down DP with Memoization: {climb_stairs_memo(n)}")
+    print(f"Top-Down DP with LRU Memo: {climb_stairs_lru(n)}")
     print(f"Bottom-Up DP with Tabulation: {climb_stairs_tabulation(n)}")
     print(f"Bottom-Up DP (Optimized Space): {climb_stairs_optimized(n)}")
     print("-" * 20)
@@ -95,6 +121,10 @@ def main():
     n = 45 # A number large enough to cause timeouts for the naive approach
     print(f"--- Climbing Stairs for n = {n} ---")
     print(f"Bottom-Up DP (Optimized Space): {climb_stairs_optimized(n)}")
+    print(f"Top-Down DP with LRU Memo: {climb_stairs_lru(n)}")
+    info = climb_stairs_lru.cache_info()
+    print(f"LRU memo stats: hits={info['hits']}, misses={info['misses']}, "
+          f"evictions={info['evictions']}, size={info['size']}")
     print("-" * 20)
 
 
@@ -0,0 +1,238 @@
+# graphs/csr_graph.py
+
+"""
+A frozen graph in compressed sparse row (CSR) form: vertices are interned
+to integers and all adjacency lists are packed into two typed arrays.
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+from array import array
+
+from graph_traversals import Graph
+
+
+class CSRGraph:
+    """
+    An immutable graph stored as two flat integer arrays.
+
+    Approach:
+    - Every vertex label (any hashable) is interned once: `vertices[i]` is
+      the label of vertex i and `index[label]` is i.
+    - The neighbors of vertex i are `targets[offsets[i]:offsets[i + 1]]`.
+      `offsets` has n + 1 entries and `targets` one entry per directed edge
+      (two per undirected edge), each a 4-byte integer in an `array`
+      instead of a pointer to a Python object in a per-vertex list.
+    - The arrays are filled by a counting sort over the edges: count each
+      vertex's degree, turn the counts into offsets with a prefix sum, then
+      drop each edge into its slot. Edges keep their insertion order, so
+      traversals visit neighbors in the same order as `Graph`.
+    Traversals then run on integer indexes with a `bytearray` of visited
+    flags rather than hashing labels into a `set`.
+
+    Time Complexity: O(V + E) to build; a neighbor scan is O(degree).
+    Space Complexity: O(V + E), about 4 bytes per directed edge.
+    """
+    def __init__(self, edges, directed=False, vertices=()):
+        """
+        Builds the graph from an iterable of (u, v) pairs. Isolated vertices
+        can be listed in `vertices`; an undirected edge is stored both ways.
+        """
+        self.vertices = []
+        self.index = {}
+        for vertex in vertices:
+            self._intern(vertex)
+        sources, destinations = array('l'), array('l')
+        intern = self._intern
+        for u, v in edges:
+            u, v = intern(u), intern(v)
+            sources.append(u)
+            destinations.append(v)
+            if not directed:
+                sources.append(v)
+                destinations.append(u)
+        self.directed = directed
+
+        n = len(self.vertices)
+        offsets = array('q', [0]) * (n + 1)
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        # 4-byte vertex indexes halve the biggest array whenever they fit.
+        targets = array('i' if n < 2**31 else 'q', [0]) * len(sources)
+        cursor = offsets[:-1]  # Next free slot of each vertex
+        for u, v in zip(sources, destinations):
+            targets[cursor[u]] = v
+            cursor[u] += 1
+        self.offsets, self.targets = offsets, targets
+
+    def _intern(self, vertex):
+        i = self.index.get(vertex)
+        if i is None:
+            i = self.index[vertex] = len(self.vertices)
+            self.vertices.append(vertex)
+        return i
+
+    @classmethod
+    def from_graph(cls, graph: Graph):
+        """Freezes a `Graph` (whose adjacency lists already hold both directions)."""
+        edges = ((u, v) for u, neighbors in graph.adj_list.items() for v in neighbors)
+        # Build as directed so each arc is stored once, then mark the result
+        # undirected: `adj_list` is symmetric, so it is.
+        csr = cls(edges, directed=True, vertices=graph.adj_list)
+        csr.directed = False
+        return csr
+
+    def __len__(self):
+        return len(self.vertices)
+
+    @property
+    def num_edges(self):
+        """The number of stored (directed) adjacency entries."""
+        return len(self.targets)
+
+    def degree(self, vertex):
+        i = self.index[vertex]
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbors(self, vertex):
+        """Returns the labels of a vertex's neighbors."""
+        i = self.index[vertex]
+        vertices = self.vertices
+        return [vertices[j] for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def dfs(self, start_node):
+        """
+        Returns the vertices in the order `Graph.dfs` visits them (pre-order,
+        neighbors in insertion order), without recursion or printing.
+
+        Approach:
+        The stack holds (vertex, position of the next edge to try), which is
+        exactly the state a recursive call would keep in its frame.
+        """
+        offsets, targets = self.offsets, self.targets
+        start = self.index[start_node]
+        visited = bytearray(len(self.vertices))
+        visited[start] = 1
+        order = [start]
+        stack = [(start, offsets[start])]
+        while stack:
+            u, position = stack[-1]
+            end = offsets[u + 1]
+            while position < end and visited[targets[position]]:
+                position += 1
+            if position == end:
+                stack.pop()
+                continue
+            stack[-1] = (u, position + 1)
+            v = targets[position]
+            visited[v] = 1
+            order.append(v)
+            stack.append((v, offsets[v]))
+        vertices = self.vertices
+        return [vertices[i] for i in order]
+
+    def bfs(self, start_node):
+        """
+        Returns the vertices in breadth-first order from `start_node`, like
+        `Graph.bfs` but without printing. The visit order list doubles as
+        the queue, with a read cursor instead of deque pops.
+        """
+        offsets, targets = self.offsets, self.targets
+        start = self.index[start_node]
+        visited = bytearray(len(self.vertices))
+        visited[start] = 1
+        order = [start]
+        head = 0
+        while head < len(order):
+            u = order[head]
+            head += 1
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    order.append(v)
+        vertices = self.vertices
+        return [vertices[i] for i in order]
+
+
+# --- Benchmark ---
+
+def random_edges(n, m, seed=42):
+    """
+    m random undirected edges over n string-labelled vertices, including a
+    path through all of them so that the graph is connected.
+    """
+    rng = random.Random(seed)
+    labels = [f"v{i}" for i in range(n)]
+    edges = [(labels[i], labels[i + 1]) for i in range(n - 1)]
+    edges += [(labels[rng.randrange(n)], labels[rng.randrange(n)])
+              for _ in range(m - (n - 1))]
+    return edges
+
+def graph_bytes(graph: Graph):
+    """Bytes held by a `Graph`'s dict and lists (the shared labels excluded)."""
+    return sys.getsizeof(graph.adj_list) + sum(map(sys.getsizeof, graph.adj_list.values()))
+
+def csr_bytes(csr: CSRGraph):
+    """Bytes held by a `CSRGraph`'s arrays, label list and index (labels excluded)."""
+    return sum(map(sys.getsizeof, (csr.offsets, csr.targets, csr.vertices, csr.index)))
+
+def benchmark(n: int, m: int):
+    edges = random_edges(n, m)
+    print(f"--- Benchmark ({n:,} vertices, {m:,} undirected edges) ---")
+
+    start = time.perf_counter()
+    graph = Graph()
+    for u, v in edges:
+        graph.add_edge(u, v)
+    print(f"Build Graph:    {time.perf_counter() - start:5.2f}s, "
+          f"{graph_bytes(graph) / 2**20:7.1f} MiB")
+    start = time.perf_counter()
+    csr = CSRGraph(edges)
+    print(f"Build CSRGraph: {time.perf_counter() - start:5.2f}s, "
+          f"{csr_bytes(csr) / 2**20:7.1f} MiB")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # Graph.bfs prints the whole path
+        expected = graph.bfs("v0")
+    graph_time = time.perf_counter() - start
+    print(f"Graph.bfs:    {2 * m / graph_time:12,.0f} edges/s")
+    start = time.perf_counter()
+    result = csr.bfs("v0")
+    csr_time = time.perf_counter() - start
+    print(f"CSRGraph.bfs: {2 * m / csr_time:12,.0f} edges/s (same order: {result == expected})")
+
+    start = time.perf_counter()
+    csr.dfs("v0")
+    print(f"CSRGraph.dfs: {2 * m / (time.perf_counter() - start):12,.0f} edges/s")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            graph.dfs("v0")
+    except RecursionError:
+        print("Graph.dfs:    RecursionError (one Python frame per vertex)")
+    print("-" * 20)
+
+def main():
+    g = Graph()
+    for u, v in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'F'), ('E', 'F')]:
+        g.add_edge(u, v)
+    csr = CSRGraph.from_graph(g)
+    print(f"Vertices: {csr.vertices}")
+    print(f"offsets = {csr.offsets.tolist()}")
+    print(f"targets = {csr.targets.tolist()}")
+    print(f"Neighbors of B: {csr.neighbors('B')}")
+    print("DFS:", " -> ".join(csr.dfs('A')))  # A -> B -> D -> E -> F -> C
+    print("BFS:", " -> ".join(csr.bfs('A')))  # A -> B -> C -> D -> E -> F
+    print("-" * 20)
+
+    # Pass sizes on the command line, e.g. `python csr_graph.py 1000000 10000000`.
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 5 * n
+    benchmark(n, m)
+
+if __name__ == "__main__":
+    main()
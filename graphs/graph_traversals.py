@@ -1,6 +1,93 @@
 # graphs/graph_traversals.py
+import sys
+import time
 from collections import deque, defaultdict
 
+# --- Traversal Engine ---
+# Iterative DFS and BFS over any `neighbors(vertex)` function. They yield
+# vertices lazily, never print, and never recurse, so graphs with millions
+# of vertices (or a path millions of edges long) are fine. Stop early by
+# simply breaking out of the loop, or from a callback.
+#
+# Callbacks receive (vertex, depth) and may return:
+PRUNE = "prune" # from pre_visit: visit this vertex but do not expand its neighbors
+STOP = "stop"   # from pre_visit or post_visit: end the whole traversal
+
+def traverse_dfs(neighbors, start, pre_visit=None, post_visit=None, max_depth=None):
+    """
+    Yields vertices in depth-first pre-order, in the same order as a
+    recursive DFS that tries neighbors in the order `neighbors` returns them.
+
+    Approach:
+    The stack holds one (vertex, iterator over its neighbors) pair per level
+    of the current path, which is exactly the state a recursive call keeps
+    in its frame. Advancing the top iterator descends; exhausting it
+    backtracks, which is when `post_visit` runs.
+
+    Vertices deeper than `max_depth` (edges from `start`) are not visited.
+    As in any depth-limited DFS, a vertex is reached via the first path
+    found, not necessarily the shortest one.
+
+    Time Complexity: O(V + E). Space Complexity: O(V) for `visited` and the stack.
+    """
+    action = pre_visit(start, 0) if pre_visit else None
+    if action is STOP:
+        return
+    visited = {start}
+    yield start
+    if action is PRUNE or max_depth == 0:
+        children = ()
+    else:
+        children = iter(neighbors(start))
+    stack = [(start, children)]
+    while stack:
+        vertex, children = stack[-1]
+        depth = len(stack) - 1
+        for child in children:
+            if child not in visited:
+                break
+        else:
+            stack.pop()
+            if post_visit and post_visit(vertex, depth) is STOP:
+                return
+            continue
+        visited.add(child)
+        action = pre_visit(child, depth + 1) if pre_visit else None
+        if action is STOP:
+            return
+        yield child
+        if action is PRUNE or depth + 1 == max_depth:
+            children = ()
+        else:
+            children = iter(neighbors(child))
+        stack.append((child, children))
+
+def traverse_bfs(neighbors, start, pre_visit=None, post_visit=None, max_depth=None):
+    """
+    Yields vertices in breadth-first order (level by level from `start`).
+
+    `pre_visit` runs as a vertex is dequeued, just before it is yielded;
+    `post_visit` runs once its unvisited neighbors have been enqueued.
+    Vertices more than `max_depth` edges from `start` are not visited.
+
+    Time Complexity: O(V + E). Space Complexity: O(V).
+    """
+    visited = {start}
+    queue = deque([(start, 0)])
+    while queue:
+        vertex, depth = queue.popleft()
+        action = pre_visit(vertex, depth) if pre_visit else None
+        if action is STOP:
+            return
+        yield vertex
+        if action is not PRUNE and depth != max_depth:
+            for neighbor in neighbors(vertex):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1))
+        if post_visit and post_visit(vertex, depth) is STOP:
+            return
+
 class Graph:
     """
     A class to represent a graph using an adjacency list.
@@ -14,20 +101,33 @@ class Graph:
         self.adj_list[u].append(v)
         self.adj_list[v].append(u)
 
+    def neighbors(self, node):
+        """Returns the neighbors of a node (without adding it to `adj_list`)."""
+        return self.adj_list.get(node, ())
+
+    def iter_dfs(self, start_node, **options):
+        """Lazily yields vertices in DFS order; see `traverse_dfs` for the options."""
+        return traverse_dfs(self.neighbors, start_node, **options)
+
+    def iter_bfs(self, start_node, **options):
+        """Lazily yields vertices in BFS order; see `traverse_bfs` for the options."""
+        return traverse_bfs(self.neighbors, start_node, **options)
+
     def dfs(self, start_node):
         """
         Performs Depth-First Search traversal starting from a given node.
 
         Approach:
-        Uses recursion (and the implicit call stack) to explore as deeply
-        as possible down one branch before backtracking. A `visited` set is
-        crucial to avoid infinite loops in graphs with cycles.
+        Explores as deeply as possible down one branch before backtracking.
+        `_dfs_recursive` shows the textbook recursive version; this method
+        uses the iterative `traverse_dfs`, which visits vertices in the same
+        order but keeps its stack on the heap, so deep graphs cannot raise
+        RecursionError. A `visited` set is crucial to avoid infinite loops
+        in graphs with cycles.
         """
         print("--- Depth-First Search (DFS) ---")
-        visited = set()
-        result = []
-        self._dfs_recursive(start_node, visited, result)
-        print("Path:", " -> ".join(result))
+        result = list(self.iter_dfs(start_node))
+        print("Path:", " -> ".join(map(str, result)))
         return result
 
     def _dfs_recursive(self, node, visited, result):
@@ -60,7 +160,7 @@ class Graph:
                     visited.add(neighbor)
                     queue.append(neighbor)
         
-        print("Path:", " -> ".join(result))
+        print("Path:", " -> ".join(map(str, result)))
         return result
 
 def main():
@@ -92,6 +192,36 @@ def main():
     # Output: A -> B -> C -> D -> E -> F
     print("")
 
+    print("--- Traversal Engine ---")
+    print("BFS within 1 edge of A:", list(g.iter_bfs('A', max_depth=1)))  # A, B, C
+    print("DFS until E is found:  ", end=" ")
+    for vertex in g.iter_dfs('A'):
+        print(vertex, end=" ")
+        if vertex == 'E':
+            break # Early termination: the rest of the graph is never explored
+    print()
+    finished = []
+    list(g.iter_dfs('A', post_visit=lambda vertex, depth: finished.append(vertex)))
+    print("DFS post-order:        ", finished)  # D, C, F, E, B, A
+    pruned = list(g.iter_dfs('A', pre_visit=lambda vertex, depth: PRUNE if vertex == 'B' else None))
+    print("DFS without expanding B:", pruned)  # A, B, C, F, E
+    print("")
+
+    # A path graph is the worst case for recursion: one frame per vertex.
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    path = Graph()
+    for i in range(n - 1):
+        path.add_edge(i, i + 1)
+    start = time.perf_counter()
+    count = sum(1 for _ in path.iter_dfs(0))
+    print(f"iter_dfs over a {n:,}-vertex path: {count:,} vertices in "
+          f"{time.perf_counter() - start:.2f}s")
+    try:
+        path._dfs_recursive(0, set(), [])
+    except RecursionError:
+        print("_dfs_recursive on the same path: RecursionError")
+    print("")
+
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
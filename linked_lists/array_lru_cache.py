@@ -0,0 +1,172 @@
+# linked_lists/array_lru_cache.py
+
+"""
+An LRU cache that keeps its recency list in preallocated integer arrays
+instead of one `Node` object per entry, compared against `LRUCache`.
+"""
+
+import time
+import tracemalloc
+from array import array
+
+from lru_cache import LRUCache
+
+
+class ArrayLRUCache:
+    """
+    An LRU cache with the same `get`/`put` contract as `LRUCache`, but whose
+    doubly linked list lives in parallel arrays indexed by slot number.
+
+    Approach:
+    Slot 0 is a sentinel that plays the role of both the dummy head and the
+    dummy tail: `next_slot[0]` is the most recently used slot and
+    `prev_slot[0]` is the least recently used one. Slots 1..capacity hold
+    entries. `prev_slot`/`next_slot` are `array('l')` buffers, so a link costs
+    a machine integer instead of a pointer to a Python object, and the keys
+    and values sit in two plain lists. The hash map stores key -> slot index.
+
+    Slots freed by `delete` go on a free list (a stack of slot indices) and
+    are reused before fresh slots. When the cache is full, the evicted slot
+    is reused directly for the new entry.
+
+    Time Complexity: O(1) for get, put and delete.
+    Space Complexity: O(capacity), allocated once up front.
+    """
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.cache = {}  # Hash map: key -> slot index
+
+        size = capacity + 1
+        self.prev_slot = array('l', [0]) * size
+        self.next_slot = array('l', [0]) * size
+        self.keys = [None] * size
+        self.vals = [None] * size
+        self.free_slots = array('l')
+        self.next_unused = 1  # Slots at or above this index were never used
+
+    def _remove(self, slot: int):
+        """Unlinks a slot from the recency list."""
+        prev_slot, next_slot = self.prev_slot, self.next_slot
+        p, n = prev_slot[slot], next_slot[slot]
+        next_slot[p] = n
+        prev_slot[n] = p
+
+    def _add_to_front(self, slot: int):
+        """Links a slot right after the sentinel (most recently used)."""
+        prev_slot, next_slot = self.prev_slot, self.next_slot
+        first = next_slot[0]
+        prev_slot[slot] = 0
+        next_slot[slot] = first
+        prev_slot[first] = slot
+        next_slot[0] = slot
+
+    def get(self, key) -> int:
+        """Retrieves an item and marks it as most recently used, or returns -1."""
+        slot = self.cache.get(key)
+        if slot is None:
+            return -1
+        if self.next_slot[0] != slot:
+            self._remove(slot)
+            self._add_to_front(slot)
+        return self.vals[slot]
+
+    def put(self, key, value) -> None:
+        """
+        Adds or updates an item. If the cache is full, the least recently
+        used entry is evicted and its slot is reused.
+        """
+        slot = self.cache.get(key)
+        if slot is not None:
+            self.vals[slot] = value
+            self._remove(slot)
+            self._add_to_front(slot)
+            return
+
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        elif self.next_unused <= self.capacity:
+            slot = self.next_unused
+            self.next_unused += 1
+        else:
+            # Evict the least recently used entry and take over its slot.
+            slot = self.prev_slot[0]
+            self._remove(slot)
+            del self.cache[self.keys[slot]]
+
+        self.keys[slot] = key
+        self.vals[slot] = value
+        self.cache[key] = slot
+        self._add_to_front(slot)
+
+    def delete(self, key) -> bool:
+        """Removes an item and returns its slot to the free list."""
+        slot = self.cache.pop(key, None)
+        if slot is None:
+            return False
+        self._remove(slot)
+        self.keys[slot] = None
+        self.vals[slot] = None  # Drop the reference so the value can be freed
+        self.free_slots.append(slot)
+        return True
+
+    def __len__(self):
+        return len(self.cache)
+
+
+def measure_memory(cache_class, n: int) -> float:
+    """Returns the bytes allocated per entry for a cache filled with n ints."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cache = cache_class(n)
+    for i in range(n):
+        cache.put(i, i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Keys and values are the same small-int objects for both caches, so the
+    # difference comes from the bookkeeping structures.
+    del cache
+    return (after - before) / n
+
+
+def measure_throughput(cache_class, capacity: int, ops: int) -> float:
+    """Returns ops/sec for a 50/50 get/put mix over twice the capacity."""
+    cache = cache_class(capacity)
+    key_space = capacity * 2
+    key = 1
+    start = time.perf_counter()
+    for n in range(ops):
+        key = (key * 1103515245 + 12345) % key_space
+        if n & 1:
+            cache.get(key)
+        else:
+            cache.put(key, n)
+    return ops / (time.perf_counter() - start)
+
+
+def main():
+    print("--- Array-Backed LRU Cache Demonstration ---")
+    cache = ArrayLRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    print(f"get(1): returns {cache.get(1)}")
+    cache.put(3, 3)  # Evicts key 2
+    print(f"put(3, 3) -> get(2): returns {cache.get(2)}")
+    cache.delete(1)
+    cache.put(4, 4)  # Reuses the slot freed by delete(1)
+    print(f"delete(1), put(4, 4) -> get(3): {cache.get(3)}, get(4): {cache.get(4)}")
+    print("-" * 20)
+
+    n = 200_000
+    print(f"--- Memory per entry ({n:,} entries) ---")
+    print(f"LRUCache (Node objects): {measure_memory(LRUCache, n):.0f} bytes")
+    print(f"ArrayLRUCache (slots):   {measure_memory(ArrayLRUCache, n):.0f} bytes")
+    print("-" * 20)
+
+    ops = 1_000_000
+    print(f"--- Throughput ({ops:,} mixed ops) ---")
+    print(f"LRUCache:      {measure_throughput(LRUCache, 100_000, ops):,.0f} ops/s")
+    print(f"ArrayLRUCache: {measure_throughput(ArrayLRUCache, 100_000, ops):,.0f} ops/s")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# linked_lists/async_lru_cache.py
+
+"""
+An asyncio front-end for `LRUCache` that coalesces concurrent misses on the
+same key into a single load and supports stale-while-revalidate.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+
+from lru_cache import LRUCache
+
+
+class AsyncLRUCache:
+    """
+    An LRU cache for asyncio programs whose values come from a slow loader
+    (a database query, an HTTP call, ...).
+
+    Approach:
+    - Request coalescing: the first coroutine that misses a key starts the
+      loader as a task and records it in `in_flight`. Every other coroutine
+      that misses the same key while the load is running awaits that same
+      task instead of starting its own, so a burst of N misses causes one
+      backend call. The task is shielded, so one waiter being cancelled
+      does not cancel the load for everybody else.
+    - Stale-while-revalidate: each entry remembers when it was loaded. After
+      `ttl` seconds it is stale. For up to `stale_ttl` further seconds the
+      stale value is still returned immediately while a single background
+      refresh runs. After that the entry counts as missing.
+    - Never blocking the loop: cache operations are O(1) in-memory work, and
+      a plain (non-async) loader is run in the default thread pool executor.
+      Whatever a loader returns is awaited if it is awaitable, so loaders
+      that merely return a coroutine work too.
+
+    Entries are stored in the `LRUCache` as (value, loaded_at) pairs, which
+    also keeps a legitimate value of -1 distinct from a miss.
+
+    Time Complexity: O(1) per lookup, plus one loader call per key per refresh.
+    Space Complexity: O(capacity) plus one task per key being loaded.
+    """
+    def __init__(self, capacity: int, ttl: float = None, stale_ttl: float = 0,
+                 clock=time.monotonic):
+        self.cache = LRUCache(capacity)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.clock = clock
+        self.in_flight = {}  # key -> asyncio.Task loading that key
+        self.loads = 0       # Number of loader calls actually made
+
+    async def _call_loader(self, key, loader):
+        self.loads += 1
+        if _is_async_callable(loader):
+            result = loader(key)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, loader, key)
+        # A loader we could not recognize as async (e.g. a lambda returning
+        # a coroutine) still hands back an awaitable; await it here.
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _load_and_store(self, key, loader):
+        try:
+            value = await self._call_loader(key, loader)
+            self.cache.put(key, (value, self.clock()))
+            return value
+        finally:
+            # Forget the load as soon as it finishes, whether it succeeded or
+            # not, so the next miss on this key starts a fresh one.
+            self.in_flight.pop(key, None)
+
+    def _start_load(self, key, loader) -> asyncio.Task:
+        """Starts loading a key unless a load for it is already running."""
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_and_store(key, loader))
+            self.in_flight[key] = task
+        return task
+
+    async def get_or_load(self, key, loader):
+        """
+        Returns the cached value for `key`, calling `loader(key)` (a coroutine
+        function, a plain function, or any callable returning an awaitable)
+        on a miss. Concurrent misses on the
+        same key share a single loader call; loader errors are raised to
+        every waiter and nothing is cached.
+        """
+        entry = self.cache.get(key)
+        if entry != -1:
+            value, loaded_at = entry
+            if self.ttl is None:
+                return value
+            age = self.clock() - loaded_at
+            if age <= self.ttl:
+                return value
+            if age <= self.ttl + self.stale_ttl:
+                # Serve the stale value now and refresh in the background.
+                task = self._start_load(key, loader)
+                task.add_done_callback(_ignore_refresh_error)
+                return value
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def get(self, key):
+        """Returns a cached value (fresh or stale) without loading, or -1."""
+        entry = self.cache.get(key)
+        return -1 if entry == -1 else entry[0]
+
+    def put(self, key, value) -> None:
+        """Stores a value directly, as if it had just been loaded."""
+        self.cache.put(key, (value, self.clock()))
+
+
+def _is_async_callable(loader) -> bool:
+    """True for `async def` functions, partials of them and objects with an async `__call__`."""
+    while isinstance(loader, functools.partial):
+        loader = loader.func
+    return (inspect.iscoroutinefunction(loader)
+            or inspect.iscoroutinefunction(getattr(loader, "__call__", None)))
+
+def _ignore_refresh_error(task: asyncio.Task):
+    # A failed background refresh leaves the stale value in place; retrieving
+    # the exception stops asyncio from logging "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
+
+async def demo():
+    print("--- Request Coalescing ---")
+    backend_calls = 0
+
+    async def slow_loader(key):
+        nonlocal backend_calls
+        backend_calls += 1
+        await asyncio.sleep(0.05)  # Pretend to be a database query
+        return f"value-for-{key}"
+
+    cache = AsyncLRUCache(capacity=100)
+    results = await asyncio.gather(*(cache.get_or_load("user:42", slow_loader)
+                                     for _ in range(200)))
+    print(f"200 concurrent misses -> {backend_calls} backend call(s), "
+          f"all got {results[0]!r}: {len(set(results)) == 1}")
+    print("-" * 20)
+
+    print("--- Stale-While-Revalidate ---")
+    now = [0.0]
+    version = 0
+
+    async def versioned_loader(key):
+        nonlocal version
+        version += 1
+        return f"{key}@v{version}"
+
+    cache = AsyncLRUCache(capacity=10, ttl=10, stale_ttl=30, clock=lambda: now[0])
+    print(f"t=0:  {await cache.get_or_load('config', versioned_loader)}")
+    now[0] = 15  # Stale, but within the stale window
+    print(f"t=15: {await cache.get_or_load('config', versioned_loader)} (stale, refreshing)")
+    await asyncio.sleep(0)  # Let the background refresh run
+    print(f"t=15: {await cache.get_or_load('config', versioned_loader)} (refreshed)")
+    now[0] = 100  # Far too old: treated as a miss
+    print(f"t=100: {await cache.get_or_load('config', versioned_loader)}")
+    print("-" * 20)
+
+    print("--- Plain Function Loader ---")
+
+    def blocking_loader(key):
+        time.sleep(0.01)  # Runs in a worker thread, not on the event loop
+        return key.upper()
+
+    cache = AsyncLRUCache(capacity=10)
+    print(f"get_or_load('abc') -> {await cache.get_or_load('abc', blocking_loader)}")
+    print("-" * 20)
+
+def main():
+    asyncio.run(demo())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+# linked_lists/cache_policies.py
+
+"""
+Scan-resistant cache policies built from the same hash map + doubly linked
+list machinery as `LRUCache`: Segmented LRU, 2Q and W-TinyLFU, plus a
+trace-replay benchmark comparing them with plain LRU.
+"""
+
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+from lru_cache import Node, LRUCache
+
+
+class RecencyList:
+    """
+    A doubly linked list of `Node`s with dummy head and tail nodes, exactly
+    like the one inside `LRUCache`, but usable on its own so a policy can
+    keep several of them. The front is the most recently used end.
+    """
+    def __init__(self):
+        self.head = Node(0, 0)
+        self.tail = Node(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.size = 0
+
+    def remove(self, node: Node):
+        """Removes a node from the list."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self.size -= 1
+
+    def add_to_front(self, node: Node):
+        """Adds a node right after the dummy head (most recently used)."""
+        node.prev = self.head
+        node.next = self.head.next
+        self.head.next.prev = node
+        self.head.next = node
+        self.size += 1
+
+    def move_to_front(self, node: Node):
+        self.remove(node)
+        self.add_to_front(node)
+
+    def peek_lru(self) -> Node:
+        """Returns the least recently used node, or None if the list is empty."""
+        return self.tail.prev if self.size else None
+
+    def pop_lru(self) -> Node:
+        """Removes and returns the least recently used node."""
+        node = self.tail.prev
+        self.remove(node)
+        return node
+
+    def __len__(self):
+        return self.size
+
+
+# --- Segmented LRU ---
+
+class SLRUCache:
+    """
+    Segmented LRU: the cache is split into a probation segment and a
+    protected segment.
+
+    Approach:
+    New items enter the front of the probation segment. An item is promoted
+    to the protected segment only when it is hit a second time. When the
+    protected segment overflows, its least recently used item is demoted
+    back to the front of probation. Eviction always takes the least recently
+    used probation item, so a one-pass scan can only churn the probation
+    segment and never flushes the items that have proven to be popular.
+
+    Time Complexity: O(1) for get and put.
+    Space Complexity: O(capacity).
+    """
+    def __init__(self, capacity: int, protected_ratio: float = 0.8):
+        self.capacity = capacity
+        self.protected_capacity = int(capacity * protected_ratio)
+        self.cache = {}  # Hash map: key -> Node
+        self.probation = RecencyList()
+        self.protected = RecencyList()
+
+    def _promote(self, node: Node):
+        """Moves a node to the front of the protected segment."""
+        node.protected = True
+        self.protected.add_to_front(node)
+        if len(self.protected) > self.protected_capacity:
+            demoted = self.protected.pop_lru()
+            demoted.protected = False
+            self.probation.add_to_front(demoted)
+
+    def _touch(self, node: Node):
+        """Records a hit on a node that is already cached."""
+        if node.protected:
+            self.protected.move_to_front(node)
+        else:
+            self.probation.remove(node)
+            self._promote(node)
+
+    def victim(self) -> Node:
+        """Returns the node that would be evicted next."""
+        return self.probation.peek_lru() or self.protected.peek_lru()
+
+    def evict(self) -> Node:
+        """Evicts and returns the next victim."""
+        node = self.victim()
+        if node.protected:
+            self.protected.remove(node)
+        else:
+            self.probation.remove(node)
+        del self.cache[node.key]
+        return node
+
+    def get(self, key):
+        node = self.cache.get(key)
+        if node is None:
+            return -1
+        self._touch(node)
+        return node.val
+
+    def put(self, key, value) -> None:
+        node = self.cache.get(key)
+        if node is not None:
+            node.val = value
+            self._touch(node)
+            return
+        if len(self.cache) >= self.capacity:
+            self.evict()
+        node = Node(key, value)
+        node.protected = False
+        self.cache[key] = node
+        self.probation.add_to_front(node)
+
+
+# --- 2Q ---
+
+class TwoQueueCache:
+    """
+    The "full" 2Q policy (Johnson and Shasha).
+
+    Approach:
+    - A1in is a FIFO queue for items seen once. Hits in A1in do not move them.
+    - A1out remembers only the *keys* recently evicted from A1in (ghosts).
+    - Am is an LRU list for items that were requested again after leaving
+      A1in, i.e. items with proven reuse.
+    A miss on a key found in A1out goes straight into Am; any other miss
+    goes into A1in. A scan therefore passes through A1in and A1out without
+    ever touching Am.
+
+    Time Complexity: O(1) for get and put.
+    Space Complexity: O(capacity) values plus O(out_ratio * capacity) ghost keys.
+    """
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        self.capacity = capacity
+        self.in_capacity = max(1, int(capacity * in_ratio))
+        self.out_capacity = max(1, int(capacity * out_ratio))
+        self.cache = {}  # Hash map: key -> Node (items in A1in or Am)
+        self.a1in = RecencyList()
+        self.am = RecencyList()
+        self.a1out = OrderedDict()  # Ghost keys, oldest first
+
+    def _make_room(self):
+        if len(self.cache) < self.capacity:
+            return
+        if len(self.a1in) > self.in_capacity or not len(self.am):
+            node = self.a1in.pop_lru()
+            del self.cache[node.key]
+            self.a1out[node.key] = None
+            if len(self.a1out) > self.out_capacity:
+                self.a1out.popitem(last=False)
+        else:
+            node = self.am.pop_lru()
+            del self.cache[node.key]
+
+    def get(self, key):
+        node = self.cache.get(key)
+        if node is None:
+            return -1
+        if node.in_am:
+            self.am.move_to_front(node)
+        return node.val
+
+    def put(self, key, value) -> None:
+        node = self.cache.get(key)
+        if node is not None:
+            node.val = value
+            if node.in_am:
+                self.am.move_to_front(node)
+            return
+        self._make_room()
+        node = Node(key, value)
+        self.cache[key] = node
+        if key in self.a1out:
+            del self.a1out[key]
+            node.in_am = True
+            self.am.add_to_front(node)
+        else:
+            node.in_am = False
+            self.a1in.add_to_front(node)
+
+
+# --- W-TinyLFU ---
+
+_MASK64 = (1 << 64) - 1
+
+def _row_hashes(key):
+    """
+    Returns (start, step) for double hashing a key across the sketch rows.
+    `hash` is the identity on small ints, so it is first scrambled with an
+    odd 64-bit multiplier; the two halves of the product then give every
+    key its own start and step, and keys that share a counter in one row
+    are unlikely to share one in the others.
+    """
+    h = (hash(key) * 0x9E3779B97F4A7C15) & _MASK64
+    return h >> 32, (h & 0xFFFFFFFF) | 1
+
+class CountMinSketch:
+    """
+    A count-min sketch: `depth` rows of `width` counters. A key increments
+    one counter per row and its estimated frequency is the minimum of those
+    counters, which can over-estimate but never under-estimate.
+
+    Counters saturate at `max_count`, and after `sample_size` increments all
+    counters are halved so that the sketch forgets old popularity ("aging").
+    """
+    def __init__(self, width: int, depth: int = 4, max_count: int = 15,
+                 sample_size: int = None):
+        self.width = width
+        self.depth = depth
+        self.max_count = max_count
+        self.sample_size = sample_size or 10 * width
+        self.additions = 0
+        self.rows = [array('l', [0]) * width for _ in range(depth)]
+
+    def increment(self, key) -> None:
+        h, step = _row_hashes(key)
+        width, max_count = self.width, self.max_count
+        for row in self.rows:
+            i = h % width
+            if row[i] < max_count:
+                row[i] += 1
+            h += step
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key) -> int:
+        h, step = _row_hashes(key)
+        width = self.width
+        count = self.max_count
+        for row in self.rows:
+            value = row[h % width]
+            if value < count:
+                count = value
+            h += step
+        return count
+
+    def _age(self):
+        for row in self.rows:
+            for i in range(self.width):
+                row[i] >>= 1
+        self.additions //= 2
+
+
+class WTinyLFUCache:
+    """
+    W-TinyLFU: a small LRU "window" in front of a large Segmented LRU, with
+    a frequency-based admission filter between them.
+
+    Approach:
+    Every access is counted in a `CountMinSketch`. New items always enter
+    the window, so a burst of new but soon-popular keys is not rejected
+    outright. When the window overflows, its LRU item becomes a candidate
+    for the main SLRU. If the main cache is full, the candidate is admitted
+    only if the sketch says it is more frequent than the SLRU's next victim;
+    otherwise the candidate is dropped. Keys from a one-pass scan have a
+    frequency of about 1 and lose against any popular victim.
+
+    Time Complexity: O(depth) per operation for the sketch, O(1) otherwise.
+    Space Complexity: O(capacity) plus the fixed-size sketch.
+    """
+    def __init__(self, capacity: int, window_ratio: float = 0.01):
+        main_capacity = max(1, capacity - max(1, int(capacity * window_ratio)))
+        self.capacity = capacity
+        self.window_capacity = capacity - main_capacity
+        self.window = RecencyList()
+        self.window_cache = {}  # Hash map: key -> Node (window items)
+        self.main = SLRUCache(main_capacity)
+        self.sketch = CountMinSketch(width=max(64, 4 * capacity))
+
+    def get(self, key):
+        self.sketch.increment(key)
+        node = self.window_cache.get(key)
+        if node is not None:
+            self.window.move_to_front(node)
+            return node.val
+        return self.main.get(key)
+
+    def put(self, key, value) -> None:
+        node = self.window_cache.get(key)
+        if node is not None:
+            node.val = value
+            self.window.move_to_front(node)
+            return
+        if key in self.main.cache:
+            self.main.put(key, value)
+            return
+
+        self.sketch.increment(key)
+        node = Node(key, value)
+        self.window_cache[key] = node
+        self.window.add_to_front(node)
+        if len(self.window) > self.window_capacity:
+            candidate = self.window.pop_lru()
+            del self.window_cache[candidate.key]
+            self._admit(candidate)
+
+    def _admit(self, candidate: Node):
+        """Moves a window candidate into the main cache if it is worth it."""
+        main = self.main
+        if len(main.cache) >= main.capacity:
+            victim = main.victim()
+            if self.sketch.estimate(candidate.key) <= self.sketch.estimate(victim.key):
+                return  # The candidate loses and is dropped
+            main.evict()
+        main.put(candidate.key, candidate.val)
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "slru": SLRUCache,
+    "2q": TwoQueueCache,
+    "tinylfu": WTinyLFUCache,
+}
+
+def make_cache(policy: str, capacity: int, **options):
+    """Creates a cache for one of the names in `POLICIES`."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown cache policy {policy!r}, choose from {sorted(POLICIES)}")
+    return POLICIES[policy](capacity, **options)
+
+
+# --- Trace Replay Benchmark ---
+
+def make_trace(length: int, num_keys: int, scan_every: int, scan_length: int, seed: int = 42):
+    """
+    Builds an access trace of Zipf-distributed keys, interrupted every
+    `scan_every` accesses by a scan over `scan_length` never-seen keys.
+    """
+    rng = random.Random(seed)
+    weights = [1 / (rank ** 0.9) for rank in range(1, num_keys + 1)]
+    hot = rng.choices(range(num_keys), weights=weights, k=length)
+    trace = []
+    next_scan_key = num_keys
+    for i, key in enumerate(hot):
+        if i and i % scan_every == 0:
+            trace.extend(range(next_scan_key, next_scan_key + scan_length))
+            next_scan_key += scan_length
+        trace.append(key)
+    return trace
+
+def replay(cache, trace):
+    """Replays a trace as get-then-put-on-miss. Returns (hit ratio, ops/sec)."""
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) == -1:
+            cache.put(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed
+
+
+def main():
+    print("--- Scan Resistance ---")
+    # "a" and "b" are requested repeatedly, with some other traffic in
+    # between, and then a one-pass scan over 100 new keys arrives.
+    warmup = ["a", "b", "a", "b"] + [f"f{i}" for i in range(7)] + ["a", "b", "a", "b"]
+    for policy in POLICIES:
+        cache = make_cache(policy, 8)
+        for key in warmup:
+            if cache.get(key) == -1:
+                cache.put(key, key)
+        for key in range(100):
+            if cache.get(key) == -1:
+                cache.put(key, key)
+        survived = [key for key in ("a", "b") if cache.get(key) != -1]
+        print(f"{policy:>8}: popular keys surviving the scan: {survived}")
+    print("-" * 20)
+
+    trace = make_trace(length=200_000, num_keys=20_000, scan_every=20_000, scan_length=5_000)
+    print(f"--- Trace Replay ({len(trace):,} accesses, capacity 1,000) ---")
+    for policy in POLICIES:
+        hit_ratio, ops = replay(make_cache(policy, 1000), trace)
+        print(f"{policy:>8}: hit ratio {hit_ratio:6.2%}, {ops:,.0f} ops/s")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
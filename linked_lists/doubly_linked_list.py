@@ -1,5 +1,9 @@
 # linked_lists/doubly_linked_list.py
 
+import random
+import time
+import tracemalloc
+
 class Node:
     """A node in a doubly linked list."""
     def __init__(self, data):
@@ -7,18 +11,47 @@ class Node:
         self.next = None
         self.prev = None
 
+class IndexedNode(Node):
+    """A node that is also linked to the other nodes holding the same value."""
+    def __init__(self, data):
+        super().__init__(data)
+        self.next_same = None
+        self.prev_same = None
+
 class DoublyLinkedList:
-    """A class representing a doubly linked list."""
-    def __init__(self):
+    """
+    A class representing a doubly linked list.
+
+    With `indexed=True` the list also keeps a hash index from each value to
+    the nodes holding it. The nodes of one value form a second doubly
+    linked chain (`prev_same`/`next_same`) in list order, and the index
+    maps the value to that chain's [first, last] nodes. Because nodes are
+    only ever added at the two ends of the list, append adds at the end of
+    the chain and prepend at its start, so the chain's first node is always
+    the first occurrence. Adding, unlinking and `delete(key)` are then O(1)
+    however often a value repeats, instead of a scan from the head.
+    """
+    def __init__(self, indexed=False):
         self.head = None
         self.tail = None
+        self.size = 0
+        self.index = {} if indexed else None  # value -> [first node, last node]
+
+    def __len__(self):
+        """Returns the number of nodes. Time Complexity: O(1)."""
+        return self.size
 
     def append(self, data):
         """
-        Appends a new node to the end of the list.
+        Appends a new node to the end of the list and returns it.
         Time Complexity: O(1) because we use a tail pointer.
         """
-        new_node = Node(data)
+        if self.index is None:
+            new_node = Node(data)
+        else:
+            # Index first: unhashable data must fail before the list changes.
+            new_node = IndexedNode(data)
+            self._index_add(new_node, at_end=True)
         if not self.head:
             self.head = new_node
             self.tail = new_node
@@ -26,13 +59,19 @@ class DoublyLinkedList:
             self.tail.next = new_node
             new_node.prev = self.tail
             self.tail = new_node
+        self.size += 1
+        return new_node
 
     def prepend(self, data):
         """
-        Prepends a new node to the beginning of the list.
+        Prepends a new node to the beginning of the list and returns it.
         Time Complexity: O(1).
         """
-        new_node = Node(data)
+        if self.index is None:
+            new_node = Node(data)
+        else:
+            new_node = IndexedNode(data)
+            self._index_add(new_node, at_end=False)
         if not self.head:
             self.head = new_node
             self.tail = new_node
@@ -40,24 +79,84 @@ class DoublyLinkedList:
             self.head.prev = new_node
             new_node.next = self.head
             self.head = new_node
+        self.size += 1
+        return new_node
+
+    def _index_add(self, node, at_end):
+        """Adds a node to its value's chain, at the end or at the start."""
+        ends = self.index.get(node.data)  # Raises TypeError for unhashable data
+        if ends is None:
+            self.index[node.data] = [node, node]
+        elif at_end:
+            ends[1].next_same = node
+            node.prev_same = ends[1]
+            ends[1] = node
+        else:
+            ends[0].prev_same = node
+            node.next_same = ends[0]
+            ends[0] = node
+
+    def _index_remove(self, node):
+        """Splices a node out of its value's chain."""
+        ends = self.index[node.data]
+        if node.prev_same:
+            node.prev_same.next_same = node.next_same
+        else:
+            ends[0] = node.next_same
+        if node.next_same:
+            node.next_same.prev_same = node.prev_same
+        else:
+            ends[1] = node.prev_same
+        if ends[0] is None:
+            del self.index[node.data]
+        node.prev_same = node.next_same = None
+
+    def _unlink(self, node):
+        # If it's not the head, update the previous node's next pointer
+        if node.prev:
+            node.prev.next = node.next
+        else: # It is the head
+            self.head = node.next
+
+        # If it's not the tail, update the next node's prev pointer
+        if node.next:
+            node.next.prev = node.prev
+        else: # It is the tail
+            self.tail = node.prev
+
+        node.prev = node.next = None
+        self.size -= 1
+
+    def unlink(self, node):
+        """
+        Removes a node returned by `append` or `prepend`. Raises ValueError,
+        leaving the list unchanged, if the node is no longer in the list
+        (e.g. a handle that was already unlinked).
+        Time Complexity: O(1), with or without the index.
+        """
+        # `_unlink` clears both pointers, so a detached node looks like a
+        # head that is not our head.
+        if node.prev is None and self.head is not node:
+            raise ValueError("node is not in the list")
+        if self.index is not None:
+            self._index_remove(node)
+        self._unlink(node)
 
     def delete(self, key):
-        """Deletes a node with the given key."""
+        """
+        Deletes the first node with the given key.
+        Time Complexity: O(n) scan, or O(1) when the list is indexed.
+        """
+        if self.index is not None:
+            ends = self.index.get(key)
+            if ends:
+                self.unlink(ends[0])
+            return
+
         current = self.head
         while current:
             if current.data == key:
-                # If it's not the head, update the previous node's next pointer
-                if current.prev:
-                    current.prev.next = current.next
-                else: # It is the head
-                    self.head = current.next
-                
-                # If it's not the tail, update the next node's prev pointer
-                if current.next:
-                    current.next.prev = current.prev
-                else: # It is the tail
-                    self.tail = current.prev
-                
+                self._unlink(current)
                 # We can stop after finding and deleting the first occurrence
                 return
             current = current.next
@@ -116,5 +215,38 @@ def main():
     dll.display_backward()
     print("-" * 20)
 
+    print("--- Indexed List with Node Handles ---")
+    indexed = DoublyLinkedList(indexed=True)
+    handles = [indexed.append(job) for job in ["job-a", "job-b", "job-c"]]
+    indexed.unlink(handles[1])  # Cancel job-b through its handle
+    indexed.delete("job-a")     # Delete by value through the index
+    indexed.display_forward()
+    print(f"Length: {len(indexed)}")
+    print("-" * 20)
+
+    benchmark_cancellation(5_000)
+
+def benchmark_cancellation(n):
+    """Appends n jobs, then cancels all of them by value in random order."""
+    print(f"--- Cancellation Benchmark ({n:,} jobs) ---")
+    order = list(range(n))
+    random.Random(42).shuffle(order)
+    for indexed in (False, True):
+        tracemalloc.start()
+        dll = DoublyLinkedList(indexed=indexed)
+        for job in range(n):
+            dll.append(job)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for job in order:
+            dll.delete(job)
+        elapsed = time.perf_counter() - start
+        label = "with index" if indexed else "scan"
+        print(f"{label:>10}: {memory / n:5.0f} bytes/job, "
+              f"{elapsed * 1000:8.1f} ms to cancel all")
+    print("-" * 20)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,201 @@
+# linked_lists/lru_memoize.py
+
+"""
+A memoization decorator backed by `LRUCache` (or `TTLLRUCache` when a TTL
+is requested), with hit/miss/eviction counters and latency histograms.
+"""
+
+import functools
+import time
+
+from lru_cache import LRUCache
+from ttl_lru_cache import TTLLRUCache
+
+
+def make_hashable(value):
+    """
+    Converts lists, dicts and sets (recursively) into tuples and frozensets
+    so that calls with unhashable arguments can still be used as cache keys.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(make_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, make_hashable(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(make_hashable(v) for v in value)
+    return value
+
+
+def make_key(args, kwargs, typed=False, hashable=False):
+    """
+    Builds a cache key from a call's arguments.
+    - `typed=True` caches f(3) and f(3.0) separately.
+    - `hashable=True` converts unhashable arguments with `make_hashable`.
+    """
+    key = args
+    if kwargs:
+        key += (object,) + tuple(sorted(kwargs.items()))  # `object` separates the parts
+    if typed:
+        key += tuple(type(v) for v in args) + tuple(type(v) for v in kwargs.values())
+    if hashable:
+        key = make_hashable(key)
+    return key
+
+
+class LatencyHistogram:
+    """
+    Counts durations in power-of-two microsecond buckets: bucket i holds
+    calls that took less than 2**i microseconds (and at least 2**(i-1)).
+    """
+    def __init__(self, num_buckets: int = 32):
+        self.buckets = [0] * num_buckets
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        i = min(micros.bit_length(), len(self.buckets) - 1)
+        self.buckets[i] += 1
+        self.count += 1
+        self.total += seconds
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> dict:
+        """Returns the non-empty buckets as {"<N us": count}."""
+        return {f"<{1 << i}us": n for i, n in enumerate(self.buckets) if n}
+
+
+def lru_memoize(capacity: int = 128, ttl: float = None, typed: bool = False,
+                key=None):
+    """
+    Decorator that memoizes a pure function in a bounded LRU cache.
+
+    Approach:
+    Each call's arguments are turned into a key (see `make_key`, or pass a
+    custom `key(*args, **kwargs)` function). Results are stored wrapped in a
+    1-tuple because `LRUCache.get` uses -1 to signal a miss, and -1 may well
+    be a legitimate result. With `ttl` set, a `TTLLRUCache` is used so cached
+    results also expire after `ttl` seconds.
+
+    The wrapper exposes:
+    - `cache_info()`: hits, misses, evictions, size and latency histograms.
+    - `cache_clear()`: empties the cache and resets the counters.
+
+    Time Complexity: O(1) per cache lookup, plus the cost of building the key.
+    Space Complexity: O(capacity).
+    """
+    def decorator(func):
+        stats = {}
+
+        def new_cache():
+            if ttl is not None:
+                return TTLLRUCache(capacity, default_ttl=ttl)
+            return LRUCache(capacity)
+
+        def reset():
+            stats.update(hits=0, misses=0, evictions=0,
+                         hit_latency=LatencyHistogram(),
+                         miss_latency=LatencyHistogram())
+
+        cache = new_cache()
+        reset()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            if key is not None:
+                k = key(*args, **kwargs)
+            else:
+                try:
+                    k = make_key(args, kwargs, typed)
+                    hash(k)
+                except TypeError:
+                    # An argument is unhashable (e.g. a list); convert it.
+                    k = make_key(args, kwargs, typed, hashable=True)
+
+            entry = cache.get(k)
+            if entry != -1:
+                stats["hits"] += 1
+                stats["hit_latency"].record(time.perf_counter() - start)
+                return entry[0]
+
+            result = func(*args, **kwargs)
+            # The key may already be cached by now, e.g. after a recursive
+            # or concurrent miss on the same arguments; storing it again
+            # then replaces the entry instead of growing the cache.
+            is_new = k not in cache.cache
+            size_before = len(cache.cache)
+            cache.put(k, (result,))
+            # A new key grows the cache by one unless something was evicted.
+            stats["evictions"] += size_before + is_new - len(cache.cache)
+            stats["misses"] += 1
+            stats["miss_latency"].record(time.perf_counter() - start)
+            return result
+
+        def cache_info() -> dict:
+            return {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "evictions": stats["evictions"],
+                "size": len(cache.cache),
+                "capacity": capacity,
+                "hit_latency": stats["hit_latency"].summary(),
+                "miss_latency": stats["miss_latency"].summary(),
+                "mean_hit_seconds": stats["hit_latency"].mean(),
+                "mean_miss_seconds": stats["miss_latency"].mean(),
+            }
+
+        def cache_clear() -> None:
+            nonlocal cache
+            cache = new_cache()
+            reset()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def main():
+    print("--- Memoized Fibonacci ---")
+
+    @lru_memoize(capacity=64)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(f"fib(60) = {fib(60)}")
+    info = fib.cache_info()
+    print(f"hits={info['hits']} misses={info['misses']} evictions={info['evictions']}")
+    print("-" * 20)
+
+    print("--- Bounded Cache ---")
+
+    @lru_memoize(capacity=2)
+    def square(x):
+        return x * x
+
+    for x in (1, 2, 1, 3, 2):
+        square(x)
+    info = square.cache_info()
+    print(f"Calls 1, 2, 1, 3, 2 with capacity 2 -> hits={info['hits']}, "
+          f"misses={info['misses']}, evictions={info['evictions']}")
+    print("-" * 20)
+
+    print("--- Unhashable and Typed Arguments ---")
+
+    @lru_memoize(typed=True)
+    def total(values):
+        return sum(values)
+
+    total([1, 2, 3])
+    total([1, 2, 3])        # Same list contents -> hit
+    total((1, 2, 3))        # typed=True: a tuple is cached apart from a list
+    print(f"total([1, 2, 3]) twice, then a tuple: {total.cache_info()['hits']} hit(s)")
+    print(f"Miss latency histogram: {total.cache_info()['miss_latency']}")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
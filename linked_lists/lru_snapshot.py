@@ -0,0 +1,244 @@
+# linked_lists/lru_snapshot.py
+
+"""
+Snapshots and an append-only journal for `LRUCache`, so a restarted process
+can warm-start with the same entries in the same recency order.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+from lru_cache import LRUCache
+
+SNAPSHOT_MAGIC = b"LRUSNAP1"
+HEADER = struct.Struct("<8sQ")     # magic, number of entries
+ENTRY = struct.Struct("<II")       # key length, value length
+RECORD = struct.Struct("<cII")     # op, key length, value length
+PUT, DELETE = b"P", b"D"
+
+
+class LazyValue:
+    """
+    A value that still lives, pickled, inside a memory-mapped snapshot file.
+    It is only unpickled the first time somebody reads it.
+    """
+    __slots__ = ("buffer", "offset", "length")
+
+    def __init__(self, buffer, offset: int, length: int):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = length
+
+    def raw(self) -> bytes:
+        return self.buffer[self.offset:self.offset + self.length]
+
+    def load(self):
+        return pickle.loads(self.raw())
+
+
+def _encode_value(val) -> bytes:
+    # Values that were never read since the restore are copied as-is,
+    # without a pickle round trip.
+    return val.raw() if isinstance(val, LazyValue) else pickle.dumps(val)
+
+
+def write_snapshot(cache: LRUCache, path: str) -> int:
+    """
+    Writes every entry of `cache` to `path`, most recently used first
+    (walking from `head.next` to `tail`). The file is written to a temporary
+    name and atomically renamed, so a crash never leaves a half-written
+    snapshot behind. Returns the number of entries written.
+
+    Layout: header (magic, count), then per entry
+    (key length, value length, pickled key, pickled value).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    count = 0
+    with os.fdopen(fd, "wb") as f:
+        f.write(HEADER.pack(SNAPSHOT_MAGIC, 0))  # Count is patched below
+        node = cache.head.next
+        while node is not cache.tail:
+            key_bytes = pickle.dumps(node.key)
+            val_bytes = _encode_value(node.val)
+            f.write(ENTRY.pack(len(key_bytes), len(val_bytes)))
+            f.write(key_bytes)
+            f.write(val_bytes)
+            count += 1
+            node = node.next
+        f.seek(0)
+        f.write(HEADER.pack(SNAPSHOT_MAGIC, count))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+def read_snapshot(path: str):
+    """
+    Memory-maps a snapshot and yields (key, LazyValue) pairs, most recently
+    used first. Only the keys are unpickled here.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            return
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count = HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not an LRU snapshot")
+    pos = HEADER.size
+    for _ in range(count):
+        key_len, val_len = ENTRY.unpack_from(buffer, pos)
+        pos += ENTRY.size
+        key = pickle.loads(buffer[pos:pos + key_len])
+        pos += key_len
+        yield key, LazyValue(buffer, pos, val_len)
+        pos += val_len
+
+
+def read_journal(path: str):
+    """
+    Yields (op, key, value) records from a journal. A torn record at the
+    end (e.g. from a crash during a write) is ignored.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while pos + RECORD.size <= len(data):
+        op, key_len, val_len = RECORD.unpack_from(data, pos)
+        end = pos + RECORD.size + key_len + val_len
+        if end > len(data):
+            break
+        key_start = pos + RECORD.size
+        key = pickle.loads(data[key_start:key_start + key_len])
+        value = pickle.loads(data[key_start + key_len:end]) if op == PUT else None
+        yield op, key, value
+        pos = end
+
+
+class PersistentLRUCache(LRUCache):
+    """
+    An `LRUCache` that survives restarts.
+
+    Approach:
+    - `checkpoint()` writes a full snapshot of the recency list and then
+      empties the journal.
+    - Between checkpoints, every `put` and `delete` is appended to a small
+      journal file, so taking periodic snapshots stays cheap and a crash
+      loses at most the writes that were not yet flushed.
+    - On start-up the snapshot is memory-mapped and inserted in reverse
+      (least recently used first) so the original order is rebuilt. Values
+      stay pickled in the mapped file until their first `get`, so a large
+      snapshot loads in time proportional to its keys, not its payloads.
+      The journal is then replayed on top.
+
+    Only writes are journaled, so recency changes caused by `get` since the
+    last checkpoint are not preserved across a restart.
+
+    Time Complexity: O(1) for get/put plus one journal append per put.
+    Space Complexity: O(capacity).
+    """
+    def __init__(self, capacity: int, path: str, sync: bool = False):
+        super().__init__(capacity)
+        self.snapshot_path = path
+        self.journal_path = path + ".journal"
+        self.sync = sync
+        self._restore()
+        self.journal = open(self.journal_path, "ab")
+
+    def _restore(self):
+        if os.path.exists(self.snapshot_path):
+            entries = []
+            for key, lazy in read_snapshot(self.snapshot_path):
+                if len(entries) == self.capacity:
+                    break
+                entries.append((key, lazy))
+            for key, lazy in reversed(entries):
+                super().put(key, lazy)
+        for op, key, value in read_journal(self.journal_path):
+            if op == PUT:
+                super().put(key, value)
+            else:
+                self._delete(key)
+
+    def _append(self, op: bytes, key, value=None):
+        key_bytes = pickle.dumps(key)
+        val_bytes = pickle.dumps(value) if op == PUT else b""
+        self.journal.write(RECORD.pack(op, len(key_bytes), len(val_bytes)))
+        self.journal.write(key_bytes)
+        self.journal.write(val_bytes)
+        self.journal.flush()
+        if self.sync:
+            os.fsync(self.journal.fileno())
+
+    def get(self, key):
+        val = super().get(key)
+        if isinstance(val, LazyValue):
+            # First read since the restore: unpickle from the mapped file.
+            val = val.load()
+            self.cache[key].val = val
+        return val
+
+    def put(self, key, value) -> None:
+        self._append(PUT, key, value)
+        super().put(key, value)
+
+    def _delete(self, key) -> bool:
+        node = self.cache.pop(key, None)
+        if node is None:
+            return False
+        self._remove(node)
+        return True
+
+    def delete(self, key) -> bool:
+        """Removes an item. Returns True if it was present."""
+        self._append(DELETE, key)
+        return self._delete(key)
+
+    def checkpoint(self) -> int:
+        """Writes a fresh snapshot and truncates the journal."""
+        count = write_snapshot(self, self.snapshot_path)
+        self.journal.truncate(0)
+        self.journal.seek(0)
+        return count
+
+    def close(self) -> None:
+        self.journal.close()
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "cache.snap")
+
+    print("--- First Process ---")
+    cache = PersistentLRUCache(3, path)
+    cache.put("a", [1, 2, 3])
+    cache.put("b", {"x": 1})
+    cache.put("c", "hello")
+    print(f"checkpoint() wrote {cache.checkpoint()} entries")
+    cache.put("d", 4.5)      # Journaled; evicts "a", the least recently used
+    cache.delete("b")        # Journaled
+    cache.close()
+    print("-" * 20)
+
+    print("--- After Restart ---")
+    cache = PersistentLRUCache(3, path)
+    order = []
+    node = cache.head.next
+    while node is not cache.tail:
+        order.append(node.key)
+        node = node.next
+    print(f"Keys, most recent first: {order}")
+    print(f"'c' is still lazy: {isinstance(cache.cache['c'].val, LazyValue)}")
+    print(f"get('c') -> {cache.get('c')!r}")
+    print(f"'c' is still lazy: {isinstance(cache.cache['c'].val, LazyValue)}")
+    cache.close()
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,11 @@ class SinglyLinkedList:
     """
     def __init__(self):
         self.head = None
+        self.size = 0
+
+    def __len__(self):
+        """Returns the number of nodes. Time Complexity: O(1)."""
+        return self.size
 
     def append(self, data):
         """
@@ -21,6 +26,7 @@ class SinglyLinkedList:
         Time Complexity: O(n) because we need to traverse to the end.
         """
         new_node = Node(data)
+        self.size += 1
         if not self.head:
             self.head = new_node
             return
@@ -38,6 +44,7 @@ class SinglyLinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        self.size += 1
 
     def delete(self, key):
         """
@@ -50,6 +57,7 @@ class SinglyLinkedList:
         if current_node and current_node.data == key:
             self.head = current_node.next
             current_node = None
+            self.size -= 1
             return
 
         # Case 2: The node is somewhere else in the list
@@ -65,6 +73,7 @@ class SinglyLinkedList:
         # Unlink the node from the list
         prev_node.next = current_node.next
         current_node = None
+        self.size -= 1
 
     def display(self):
         """
@@ -102,6 +111,7 @@ def main():
     sll.delete(0)
     print("After deleting head (0):")
     sll.display() # Output: 1 -> 3
+    print(f"Length: {len(sll)}") # Output: 2
     
     # Try to delete a non-existent element
     sll.delete(99)
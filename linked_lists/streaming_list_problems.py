@@ -0,0 +1,244 @@
+# linked_lists/streaming_list_problems.py
+
+"""
+Iterative, stack-safe versions of the algorithms in `interview_problems.py`
+for very long lists. Nothing here recurses, the pointer algorithms use O(1)
+extra space (O(k) for a k-way merge), and lists can be built from and read
+into generators without ever holding all the values in a Python list.
+"""
+
+import heapq
+import itertools
+import sys
+import time
+from collections import deque
+
+from interview_problems import Node, reverse_linked_list_recursive
+
+
+# --- Lazy Construction and Consumption ---
+
+def nodes_from(values):
+    """Yields a fresh, unlinked `Node` for each value of any iterable."""
+    for value in values:
+        yield Node(value)
+
+def link(nodes):
+    """
+    Links the nodes produced by an iterable (e.g. `nodes_from`) into a list
+    and returns its head. Only the current tail is kept in memory besides
+    the list itself.
+    """
+    dummy = Node(0)
+    tail = dummy
+    for node in nodes:
+        tail.next = node
+        tail = node
+    tail.next = None
+    return dummy.next
+
+def build_linked_list(values):
+    """Builds a list from any iterable, including a generator."""
+    return link(nodes_from(values))
+
+def iter_nodes(head):
+    """
+    Yields the nodes of a list one at a time. The next pointer is read
+    before each node is handed out, so the caller may relink the node.
+    """
+    while head:
+        nxt = head.next
+        yield head
+        head = nxt
+
+def iter_values(head):
+    """Yields the values of a list one at a time."""
+    while head:
+        yield head.data
+        head = head.next
+
+
+# --- Algorithms ---
+
+def reverse(head):
+    """
+    Reverses a list in place by flipping one pointer per node.
+
+    Time Complexity: O(n). Space Complexity: O(1), with no recursion.
+    """
+    prev = None
+    while head:
+        head.next, prev, head = prev, head, head.next
+    return prev
+
+def find_middle(head):
+    """
+    Returns the middle node (the second one for even lengths) using slow and
+    fast pointers.
+
+    Time Complexity: O(n). Space Complexity: O(1).
+    """
+    slow = fast = head
+    while fast and fast.next:
+        slow = slow.next
+        fast = fast.next.next
+    return slow
+
+def iter_merge_k_sorted(heads):
+    """
+    Lazily merges k sorted lists, yielding their nodes in ascending order.
+
+    Approach:
+    A min-heap holds the current front node of every list. Each step pops
+    the smallest node, yields it and pushes that list's next node. A running
+    counter breaks ties so nodes themselves are never compared, which also
+    keeps the merge stable.
+
+    Time Complexity: O(n log k) for n nodes in total.
+    Space Complexity: O(k) for the heap.
+    """
+    counter = itertools.count()
+    heap = [(head.data, next(counter), head) for head in heads if head]
+    heapq.heapify(heap)
+    while heap:
+        _, _, node = heap[0]
+        nxt = node.next
+        if nxt:
+            heapq.heapreplace(heap, (nxt.data, next(counter), nxt))
+        else:
+            heapq.heappop(heap)
+        yield node
+
+def merge_k_sorted_lists(heads):
+    """
+    Merges k sorted lists into one by relinking their nodes.
+    `merge_two_sorted_lists` is the k = 2 case.
+    """
+    return link(iter_merge_k_sorted(heads))
+
+def find_cycle(head):
+    """
+    Floyd's algorithm, extended to report where the cycle is.
+    Returns (start_node, cycle_length), or (None, 0) if there is no cycle.
+
+    Approach:
+    1. Move `slow` by one and `fast` by two until they meet (or `fast`
+       falls off the end, meaning there is no cycle).
+    2. Walk one pointer around the cycle until it returns to the meeting
+       point to count the cycle length.
+    3. Restart one pointer at the head; advancing both one step at a time,
+       they meet exactly at the first node of the cycle.
+
+    Time Complexity: O(n). Space Complexity: O(1).
+    """
+    slow = fast = head
+    while fast and fast.next:
+        slow = slow.next
+        fast = fast.next.next
+        if slow is fast:
+            break
+    else:
+        return None, 0
+
+    length = 1
+    runner = slow.next
+    while runner is not slow:
+        runner = runner.next
+        length += 1
+
+    start = head
+    while start is not slow:
+        start = start.next
+        slow = slow.next
+    return start, length
+
+def remove_nth_from_end(head, n):
+    """
+    Removes the n-th node from the end in a single pass with two pointers.
+    Unlike the interview version, an `n` outside 1..length leaves the list
+    unchanged instead of raising an error.
+
+    Time Complexity: O(n). Space Complexity: O(1).
+    """
+    if n <= 0:
+        return head
+    dummy = Node(0)
+    dummy.next = head
+    fast = dummy
+    for _ in range(n + 1):
+        if fast is None:
+            return head
+        fast = fast.next
+    slow = dummy
+    while fast:
+        slow = slow.next
+        fast = fast.next
+    slow.next = slow.next.next
+    return dummy.next
+
+def skip_nth_from_end(values, n):
+    """
+    Streaming variant of `remove_nth_from_end`: yields every value of an
+    iterable except the n-th from the end, holding at most n values at a
+    time. Useful when the input is a generator too long to materialize.
+
+    Time Complexity: O(length). Space Complexity: O(n).
+    """
+    if n <= 0:
+        yield from values
+        return
+    window = deque()  # The last (up to) n values seen
+    for value in values:
+        if len(window) == n:
+            # The oldest buffered value now has at least n values after it,
+            # so it cannot be the n-th from the end.
+            yield window.popleft()
+        window.append(value)
+    if len(window) == n:
+        window.popleft()  # This one is the n-th from the end
+    yield from window
+
+def main():
+    print("--- Lazy Build and Read ---")
+    head = build_linked_list(x * x for x in range(1, 6))
+    print(" -> ".join(map(str, iter_values(head))))
+    print("-" * 20)
+
+    print("--- k-Way Merge ---")
+    lists = [build_linked_list(r) for r in (range(1, 10, 3), range(2, 10, 3), range(3, 10, 3))]
+    print(" -> ".join(map(str, iter_values(merge_k_sorted_lists(lists)))))
+    print("-" * 20)
+
+    print("--- Cycle Start and Length ---")
+    head = build_linked_list(range(1, 7))
+    tail = head
+    while tail.next:
+        tail = tail.next
+    tail.next = head.next.next  # 6 -> 3
+    start, length = find_cycle(head)
+    print(f"Cycle starts at {start.data} with length {length}")  # 3, 4
+    print("-" * 20)
+
+    print("--- Remove Nth From End ---")
+    print(" -> ".join(map(str, iter_values(remove_nth_from_end(build_linked_list(range(1, 6)), 2)))))
+    print(" -> ".join(map(str, skip_nth_from_end(range(1, 6), 2))) + " (streaming)")
+    print("-" * 20)
+
+    n = 2_000_000
+    print(f"--- {n:,}-Node List ---")
+    start_time = time.perf_counter()
+    head = build_linked_list(range(n))
+    head = reverse(head)
+    middle = find_middle(head)
+    merged = merge_k_sorted_lists([reverse(head), build_linked_list(range(0, n, 2))])
+    total = sum(iter_values(merged))
+    print(f"build + reverse + middle ({middle.data}) + merge + sum ({total}) "
+          f"in {time.perf_counter() - start_time:.2f}s")
+    try:
+        reverse_linked_list_recursive(build_linked_list(range(sys.getrecursionlimit() * 2)))
+    except RecursionError:
+        print("reverse_linked_list_recursive on the same scale: RecursionError")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# linked_lists/ttl_lru_cache.py
+
+"""
+An LRU cache with per-entry time-to-live (TTL) and a byte budget, built on
+the hash map + doubly linked list machinery of `LRUCache`.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+from lru_cache import Node, LRUCache
+
+
+class TTLNode(Node):
+    """A cache node that also records when it expires and how much it weighs."""
+    def __init__(self, key, val, expires_at=None, weight=1):
+        super().__init__(key, val)
+        self.expires_at = expires_at  # None means the entry never expires
+        self.weight = weight
+
+
+class TTLLRUCache(LRUCache):
+    """
+    An LRU cache whose entries can expire and whose size can be measured in
+    bytes (or any other weight) instead of by entry count.
+
+    Approach:
+    - Expiry: every node stores an `expires_at` deadline. `get` checks the
+      deadline and drops a stale entry on the spot (lazy expiry). Entries that
+      are never read again are removed by `sweep`, which pops deadlines from
+      a min-heap and handles a bounded batch per call, so it can run
+      incrementally from a background thread without long pauses.
+    - Weight: every `put` takes a weight (or computes one with `sizer`).
+      After an insert we evict from `self.tail.prev` (the least recently used
+      entry) until the total weight fits in `max_weight`.
+
+    All public methods take an internal lock so the background sweeper can
+    run alongside the caller's threads.
+
+    Time Complexity: O(1) for get; O(log n) for put when a TTL is set (heap
+    push), plus O(1) per evicted entry.
+    Space Complexity: O(n) for the entries and the expiry heap, which is
+    compacted whenever stale entries make it more than twice the cache size.
+    """
+    def __init__(self, capacity: int = None, default_ttl: float = None,
+                 max_weight: int = None, sizer=None, clock=time.monotonic):
+        super().__init__(capacity)
+        self.default_ttl = default_ttl
+        self.max_weight = max_weight
+        self.sizer = sizer
+        self.clock = clock
+        self.total_weight = 0
+        self.expiry_heap = []  # (expires_at, seq, key), cleaned lazily
+        self._seq = itertools.count()  # Tie-breaker so keys are never compared
+        self.lock = threading.RLock()
+        self._sweeper = None
+        self._stop_sweeper = threading.Event()
+
+    def _unlink(self, node: TTLNode):
+        """Removes a node from both the list and the hash map."""
+        self._remove(node)
+        del self.cache[node.key]
+        self.total_weight -= node.weight
+
+    def _is_expired(self, node: TTLNode, now: float) -> bool:
+        return node.expires_at is not None and node.expires_at <= now
+
+    def get(self, key):
+        """
+        Retrieves an item, returning -1 if it is missing or has expired.
+        A hit moves the item to the front of the list.
+        """
+        with self.lock:
+            node = self.cache.get(key)
+            if node is None:
+                return -1
+            if self._is_expired(node, self.clock()):
+                self._unlink(node)
+                return -1
+            self._remove(node)
+            self._add_to_front(node)
+            return node.val
+
+    def put(self, key, value, ttl: float = None, weight: int = None) -> None:
+        """
+        Adds or updates an item. `ttl` (seconds) overrides `default_ttl`;
+        `weight` overrides the value computed by `sizer` (default 1).
+        Items heavier than the whole budget are not cached.
+        """
+        if weight is None:
+            weight = self.sizer(value) if self.sizer else 1
+        if ttl is None:
+            ttl = self.default_ttl
+
+        with self.lock:
+            if key in self.cache:
+                self._unlink(self.cache[key])
+
+            if self.max_weight is not None and weight > self.max_weight:
+                return
+
+            expires_at = None
+            if ttl is not None:
+                expires_at = self.clock() + ttl
+                heapq.heappush(self.expiry_heap, (expires_at, next(self._seq), key))
+
+            node = TTLNode(key, value, expires_at, weight)
+            self.cache[key] = node
+            self._add_to_front(node)
+            self.total_weight += weight
+            self._evict()
+            if expires_at is not None:
+                self._compact_heap()
+
+    def _compact_heap(self):
+        """
+        Updates, evictions and deletes leave stale entries in the expiry
+        heap. Once they outnumber the live ones, rebuild the heap from the
+        current deadlines so its size stays proportional to the cache.
+        O(n) per rebuild, amortized O(1) per put.
+        """
+        if len(self.expiry_heap) > 2 * len(self.cache) + 64:
+            self.expiry_heap = [(node.expires_at, next(self._seq), key)
+                                for key, node in self.cache.items()
+                                if node.expires_at is not None]
+            heapq.heapify(self.expiry_heap)
+
+    def _evict(self):
+        """Evicts least recently used entries until both limits are met."""
+        while self.cache and (
+                (self.capacity is not None and len(self.cache) > self.capacity) or
+                (self.max_weight is not None and self.total_weight > self.max_weight)):
+            self._unlink(self.tail.prev)
+
+    def delete(self, key) -> bool:
+        """Removes an item. Returns True if it was present."""
+        with self.lock:
+            node = self.cache.get(key)
+            if node is None:
+                return False
+            self._unlink(node)
+            return True
+
+    def sweep(self, max_items: int = 100) -> int:
+        """
+        Removes up to `max_items` expired entries and returns how many were
+        removed. Heap entries left behind by updates or deletes are skipped.
+        """
+        removed = 0
+        with self.lock:
+            now = self.clock()
+            heap = self.expiry_heap
+            while heap and heap[0][0] <= now and removed < max_items:
+                expires_at, _, key = heapq.heappop(heap)
+                node = self.cache.get(key)
+                # Only remove the node if this heap entry is its current deadline.
+                if node is not None and node.expires_at == expires_at:
+                    self._unlink(node)
+                    removed += 1
+        return removed
+
+    def start_sweeper(self, interval: float = 1.0, batch: int = 100) -> None:
+        """Starts a daemon thread that calls `sweep` every `interval` seconds."""
+        if self._sweeper is not None:
+            return
+        self._stop_sweeper.clear()
+
+        def run():
+            while not self._stop_sweeper.wait(interval):
+                # Keep sweeping in small batches while there is work to do.
+                while self.sweep(batch) == batch:
+                    pass
+
+        self._sweeper = threading.Thread(target=run, daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stops the background sweeper thread, if one is running."""
+        if self._sweeper is None:
+            return
+        self._stop_sweeper.set()
+        self._sweeper.join()
+        self._sweeper = None
+
+    def __len__(self):
+        return len(self.cache)
+
+
+def main():
+    print("--- TTL Expiry ---")
+    now = [0.0]  # A fake clock so the demo does not need to sleep
+    cache = TTLLRUCache(capacity=10, default_ttl=5, clock=lambda: now[0])
+    cache.put("session", "abc")
+    cache.put("config", "xyz", ttl=60)
+    print(f"t=0:  get('session') -> {cache.get('session')}")
+    now[0] = 10
+    print(f"t=10: get('session') -> {cache.get('session')} (expired lazily)")
+    print(f"t=10: get('config')  -> {cache.get('config')}")
+    now[0] = 61
+    print(f"t=61: sweep() removed {cache.sweep()} entry, {len(cache)} left")
+    print("-" * 20)
+
+    print("--- Size-Aware Eviction ---")
+    cache = TTLLRUCache(max_weight=10, sizer=len)
+    cache.put("a", "xxxx")      # weight 4
+    cache.put("b", "xxxx")      # weight 4, total 8
+    cache.get("a")              # "b" is now least recently used
+    cache.put("c", "xxxxx")     # weight 5 -> total 13, evicts "b"
+    print(f"Keys after put('c'): {list(cache.cache)}, total weight {cache.total_weight}")
+    cache.put("huge", "x" * 50) # Heavier than the whole budget, not cached
+    print(f"get('huge') -> {cache.get('huge')}")
+    print("-" * 20)
+
+    print("--- Background Sweeper ---")
+    cache = TTLLRUCache(default_ttl=0.05)
+    for i in range(1000):
+        cache.put(i, i)
+    cache.start_sweeper(interval=0.02)
+    time.sleep(0.2)
+    cache.stop_sweeper()
+    print(f"Entries left after sweeper ran: {len(cache)}")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
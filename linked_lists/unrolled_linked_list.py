@@ -0,0 +1,252 @@
+# linked_lists/unrolled_linked_list.py
+
+"""
+An unrolled linked list: a doubly linked list of small arrays ("chunks"),
+compared against the one-node-per-element `SinglyLinkedList` and
+`DoublyLinkedList`.
+"""
+
+import time
+import tracemalloc
+
+from singly_linked_list import SinglyLinkedList
+from doubly_linked_list import DoublyLinkedList
+
+
+class Chunk:
+    """A node of an unrolled linked list, holding up to `chunk_capacity` elements."""
+    __slots__ = ("elements", "next", "prev")
+
+    def __init__(self):
+        self.elements = []
+        self.next = None
+        self.prev = None
+
+
+class UnrolledLinkedList:
+    """
+    A linked list whose nodes each store a small array of elements.
+
+    Approach:
+    Instead of one node per element, each `Chunk` holds up to
+    `chunk_capacity` elements in a list. Iteration walks the chunks and then
+    runs through each chunk's array, so there is one pointer hop per chunk
+    instead of one per element, and the per-node overhead is shared by many
+    elements.
+    - A full chunk is split in half before inserting into it, so positional
+      inserts only ever shift at most `chunk_capacity` elements.
+    - After a delete, a chunk that is less than half full is merged with its
+      successor when the two fit in one chunk, which keeps the chunks dense.
+
+    Time Complexity:
+    - append / prepend: O(1).
+    - insert / delete / get by position: O(n / B + B), B = chunk_capacity.
+    Space Complexity: O(n) with about n / B node objects instead of n.
+    """
+    def __init__(self, chunk_capacity: int = 64):
+        self.chunk_capacity = chunk_capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def _link_after(self, chunk: Chunk, new_chunk: Chunk):
+        """Links `new_chunk` right after `chunk` (or as the only chunk)."""
+        if chunk is None:
+            self.head = self.tail = new_chunk
+            return
+        new_chunk.prev = chunk
+        new_chunk.next = chunk.next
+        if chunk.next:
+            chunk.next.prev = new_chunk
+        else:
+            self.tail = new_chunk
+        chunk.next = new_chunk
+
+    def _unlink(self, chunk: Chunk):
+        if chunk.prev:
+            chunk.prev.next = chunk.next
+        else:
+            self.head = chunk.next
+        if chunk.next:
+            chunk.next.prev = chunk.prev
+        else:
+            self.tail = chunk.prev
+
+    def _split(self, chunk: Chunk):
+        """Moves the second half of a full chunk into a new chunk after it."""
+        half = len(chunk.elements) // 2
+        new_chunk = Chunk()
+        new_chunk.elements = chunk.elements[half:]
+        del chunk.elements[half:]
+        self._link_after(chunk, new_chunk)
+
+    def append(self, data):
+        """Appends an element to the end of the list. Time Complexity: O(1)."""
+        if self.tail is None or len(self.tail.elements) >= self.chunk_capacity:
+            self._link_after(self.tail, Chunk())
+        self.tail.elements.append(data)
+        self.size += 1
+
+    def prepend(self, data):
+        """Prepends an element to the beginning of the list. Time Complexity: O(1)."""
+        if self.head is None or len(self.head.elements) >= self.chunk_capacity:
+            new_chunk = Chunk()
+            if self.head is None:
+                self.head = self.tail = new_chunk
+            else:
+                new_chunk.next = self.head
+                self.head.prev = new_chunk
+                self.head = new_chunk
+        # Inserting at the front of a small array shifts at most B elements.
+        self.head.elements.insert(0, data)
+        self.size += 1
+
+    def _find(self, index: int):
+        """Returns (chunk, offset) for a position, walking chunk by chunk."""
+        chunk = self.head
+        while chunk and index >= len(chunk.elements):
+            index -= len(chunk.elements)
+            chunk = chunk.next
+        return chunk, index
+
+    def insert(self, index: int, data):
+        """Inserts an element so that it ends up at position `index`."""
+        if index <= 0:
+            return self.prepend(data)
+        if index >= self.size:
+            return self.append(data)
+        chunk, offset = self._find(index)
+        if len(chunk.elements) >= self.chunk_capacity:
+            self._split(chunk)
+            if offset > len(chunk.elements):
+                offset -= len(chunk.elements)
+                chunk = chunk.next
+        chunk.elements.insert(offset, data)
+        self.size += 1
+
+    def get(self, index: int):
+        """Returns the element at position `index`."""
+        if index < 0 or index >= self.size:
+            raise IndexError("list index out of range")
+        chunk, offset = self._find(index)
+        return chunk.elements[offset]
+
+    def delete(self, key):
+        """Deletes the first occurrence of `key`. Returns True if one was found."""
+        chunk = self.head
+        while chunk:
+            if key in chunk.elements:
+                chunk.elements.remove(key)
+                self.size -= 1
+                self._rebalance(chunk)
+                return True
+            chunk = chunk.next
+        return False
+
+    def _rebalance(self, chunk: Chunk):
+        """Removes empty chunks and merges a sparse chunk into its neighbour."""
+        if not chunk.elements:
+            self._unlink(chunk)
+            return
+        nxt = chunk.next
+        if (nxt and len(chunk.elements) < self.chunk_capacity // 2 and
+                len(chunk.elements) + len(nxt.elements) <= self.chunk_capacity):
+            chunk.elements.extend(nxt.elements)
+            self._unlink(nxt)
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            yield from chunk.elements
+            chunk = chunk.next
+
+    def __len__(self):
+        return self.size
+
+    def display(self):
+        """Displays the elements, with chunk boundaries shown as |."""
+        chunks = []
+        chunk = self.head
+        while chunk:
+            chunks.append(" -> ".join(str(x) for x in chunk.elements))
+            chunk = chunk.next
+        print(" | ".join(chunks))
+
+
+# --- Benchmark ---
+
+def build_singly(n):
+    sll = SinglyLinkedList()
+    for i in reversed(range(n)):  # `append` is O(n) there, so prepend instead
+        sll.prepend(i)
+    return sll
+
+def build_doubly(n):
+    dll = DoublyLinkedList()
+    for i in range(n):
+        dll.append(i)
+    return dll
+
+def build_unrolled(n):
+    ull = UnrolledLinkedList()
+    for i in range(n):
+        ull.append(i)
+    return ull
+
+def iterate_nodes(lst):
+    """Sums a node-per-element list by following `next` pointers."""
+    total = 0
+    node = lst.head
+    while node:
+        total += node.data
+        node = node.next
+    return total
+
+def bytes_per_element(build, n):
+    # Every layout also pays for the int objects themselves (about 28 bytes
+    # each), so the differences come from the node bookkeeping.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    lst = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lst
+    return (after - before) / n
+
+def main():
+    print("--- Unrolled Linked List Demonstration ---")
+    ull = UnrolledLinkedList(chunk_capacity=4)
+    for i in range(1, 9):
+        ull.append(i)
+    print("After appending 1..8 (chunk capacity 4):")
+    ull.display()
+    ull.prepend(0)
+    print("After prepending 0:")
+    ull.display()
+    ull.insert(5, 99)
+    print("After insert(5, 99):")
+    ull.display()
+    ull.delete(99)
+    ull.delete(6)
+    print("After deleting 99 and 6:")
+    ull.display()
+    print(f"Length: {len(ull)}, element at index 4: {ull.get(4)}")
+    print("-" * 20)
+
+    n = 500_000
+    print(f"--- Benchmark ({n:,} integers) ---")
+    for name, build, iterate in (
+            ("SinglyLinkedList", build_singly, iterate_nodes),
+            ("DoublyLinkedList", build_doubly, iterate_nodes),
+            ("UnrolledLinkedList", build_unrolled, sum)):
+        memory = bytes_per_element(build, n)
+        lst = build(n)
+        start = time.perf_counter()
+        iterate(lst)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>18}: {memory:6.1f} bytes/element, "
+              f"iteration {n / elapsed / 1e6:6.1f} M elements/s")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+import os
+import sys
 from collections import deque
 
+# The shared, slotted tree nodes live in the trees folder.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "trees"))
+from tree_nodes import TreeNode
+
 # --- Problem 1: Implement Stack using Queues ---
 
 class MyStack:
@@ -49,13 +55,6 @@ class MyStack:
 
 # --- Problem 2: Binary Tree Level Order Traversal (BFS) ---
 
-class TreeNode:
-    """A simple node for a binary tree."""
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
-
 def level_order_traversal(root: TreeNode) -> list[list[int]]:
     """
     Problem: Given the root of a binary tree, return the level order
@@ -0,0 +1,286 @@
+# trees/avl_map.py
+
+"""
+An AVL tree that owns its root and stores a value with every key, with
+iterative insert/delete and an O(n) bulk loader.
+"""
+
+import random
+import sys
+import time
+
+import ordered_queries
+from avl_tree import AVLNode, AVLTree
+from tree_nodes import subtree_size
+
+
+class AVLMapNode(AVLNode):
+    """An `AVLNode` that also carries a value."""
+    # This slot replaces the inherited `value` alias for `key`: in a map,
+    # `value` is the payload stored next to the key.
+    __slots__ = ("value",)
+
+    def __init__(self, key, value=None):
+        super().__init__(key)
+        self.value = value
+
+
+class AVLMap:
+    """
+    A sorted map backed by an AVL tree.
+
+    Approach:
+    Unlike `AVLTree`, whose methods take and return a root that the caller
+    must thread through every call, `AVLMap` keeps `self.root` itself.
+    - insert and delete are iterative: going down, every visited node is
+      pushed onto a `path` stack; coming back up, the stack is popped and
+      each node's height is updated and rebalanced with the same rotations
+      as `AVLTree`. This avoids one Python call frame per level.
+    - `bulk_load` builds a perfectly balanced tree directly from sorted
+      input by always choosing the middle element as the subtree root, so
+      it costs O(n) instead of n inserts with rotations (O(n log n)).
+
+    Time Complexity: O(log n) for get, insert and delete; O(n) for bulk_load.
+    Space Complexity: O(n) for the nodes, O(log n) for the path stack.
+    """
+    def __init__(self):
+        self.root = None
+        self.size = 0
+        self.ops = AVLTree()  # Reuses the height/balance/rotation helpers
+
+    def __len__(self):
+        return self.size
+
+    def _rebalance(self, node):
+        """Updates a node's height and size and rotates it if it is unbalanced."""
+        ops = self.ops
+        node.height = 1 + max(ops.get_height(node.left), ops.get_height(node.right))
+        node.size = 1 + subtree_size(node.left) + subtree_size(node.right)
+        balance = ops.get_balance(node)
+        if balance > 1:
+            if ops.get_balance(node.left) < 0:  # Left Right
+                node.left = ops.left_rotate(node.left)
+            return ops.right_rotate(node)       # Left Left
+        if balance < -1:
+            if ops.get_balance(node.right) > 0:  # Right Left
+                node.right = ops.right_rotate(node.right)
+            return ops.left_rotate(node)         # Right Right
+        return node
+
+    def _replace_child(self, parent, old, new):
+        """Points `parent` (or the root, if parent is None) at `new` instead of `old`."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _retrace(self, path):
+        """
+        Walks back up the path, rebalancing each node. Once a subtree ends up
+        with the same height it had before the update, the heights and
+        balances above it cannot have changed, so the remaining ancestors
+        only need their subtree sizes adjusted.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            new_subtree = self._rebalance(node)
+            if new_subtree is not node:
+                self._replace_child(path[i - 1] if i else None, node, new_subtree)
+            if new_subtree.height == old_height:
+                for ancestor in reversed(path[:i]):
+                    ancestor.size = 1 + subtree_size(ancestor.left) + subtree_size(ancestor.right)
+                return
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key`, or `default`."""
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node.value
+        return default
+
+    def __contains__(self, key):
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def insert(self, key, value=None):
+        """Inserts a key, or updates its value if it is already present."""
+        path = []
+        node = self.root
+        while node:
+            if key == node.key:
+                node.value = value
+                return
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        new_node = AVLMapNode(key, value)
+        self.size += 1
+        if not path:
+            self.root = new_node
+            return
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._retrace(path)
+
+    def delete(self, key) -> bool:
+        """Deletes a key. Returns True if it was present."""
+        path = []
+        node = self.root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left and node.right:
+            # Copy the in-order successor into this node, then delete the
+            # successor instead (it has no left child).
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node = successor
+
+        child = node.left or node.right
+        self._replace_child(path[-1] if path else None, node, child)
+        self.size -= 1
+        # Unlike insertion, this may rotate at several levels on the way up.
+        self._retrace(path)
+        return True
+
+    def bulk_load(self, sorted_items):
+        """
+        Replaces the contents with (key, value) pairs given in strictly
+        increasing key order, building a perfectly balanced tree in O(n).
+        """
+        items = list(sorted_items)
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError("bulk_load needs keys in strictly increasing order")
+
+        def build(lo, hi):
+            # Recursion depth is only O(log n): each call halves the range.
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLMapNode(*items[mid])
+            node.left = build(lo, mid - 1)
+            node.right = build(mid + 1, hi)
+            node.height = 1 + max(self.ops.get_height(node.left),
+                                  self.ops.get_height(node.right))
+            node.size = hi - lo + 1
+            return node
+
+        self.root = build(0, len(items) - 1)
+        self.size = len(items)
+
+    def select(self, k):
+        """Returns the k-th smallest key (1-based), or None. O(log n)."""
+        return ordered_queries.select(self.root, k)
+
+    def rank(self, key):
+        """Returns the number of keys strictly smaller than `key`. O(log n)."""
+        return ordered_queries.rank(self.root, key)
+
+    def count_range(self, lo, hi):
+        """Returns the number of keys k with lo <= k <= hi. O(log n)."""
+        return ordered_queries.count_range(self.root, lo, hi)
+
+    def __iter__(self):
+        """Lazily yields the keys in ascending order."""
+        return ordered_queries.irange(self.root)
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """Lazily yields (key, value) pairs with lo <= key <= hi in key order."""
+        for node in ordered_queries.iter_nodes(self.root, lo, hi, reverse):
+            yield node.key, node.value
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """Lazily yields the keys with lo <= key <= hi (either bound may be None)."""
+        return ordered_queries.irange(self.root, lo, hi, reverse)
+
+    def floor(self, key):
+        """Returns the largest key <= `key`, or None."""
+        return ordered_queries.floor(self.root, key)
+
+    def ceiling(self, key):
+        """Returns the smallest key >= `key`, or None."""
+        return ordered_queries.ceiling(self.root, key)
+
+    def successor(self, key):
+        """Returns the smallest key > `key`, or None."""
+        return ordered_queries.successor(self.root, key)
+
+    def predecessor(self, key):
+        """Returns the largest key < `key`, or None."""
+        return ordered_queries.predecessor(self.root, key)
+
+
+def benchmark(n: int):
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.Random(42).shuffle(shuffled)
+
+    print(f"--- Benchmark ({n:,} keys) ---")
+    tree, root = AVLTree(), None
+    start = time.perf_counter()
+    for key in shuffled:
+        root = tree.insert(root, key)
+    print(f"AVLTree.insert (recursive):  {time.perf_counter() - start:6.2f}s")
+
+    avl_map = AVLMap()
+    start = time.perf_counter()
+    for key in shuffled:
+        avl_map.insert(key, key)
+    print(f"AVLMap.insert (iterative):   {time.perf_counter() - start:6.2f}s")
+
+    loaded = AVLMap()
+    start = time.perf_counter()
+    loaded.bulk_load((key, key) for key in keys)
+    print(f"AVLMap.bulk_load:            {time.perf_counter() - start:6.2f}s")
+
+    start = time.perf_counter()
+    for key in shuffled:
+        root = tree.delete(root, key)
+    print(f"AVLTree.delete (recursive):  {time.perf_counter() - start:6.2f}s")
+
+    start = time.perf_counter()
+    for key in shuffled:
+        avl_map.delete(key)
+    print(f"AVLMap.delete (iterative):   {time.perf_counter() - start:6.2f}s")
+    print("-" * 20)
+
+def main():
+    avl_map = AVLMap()
+    for key in [10, 20, 30, 40, 50, 25]:
+        avl_map.insert(key, f"v{key}")
+    print(f"Root after inserts: {avl_map.root.key}")  # Expected: 30
+    print(f"Items: {list(avl_map.items())}")
+    avl_map.delete(10)
+    print(f"After deleting 10, root is {avl_map.root.key}, size {len(avl_map)}")
+    print(f"get(25) -> {avl_map.get(25)}, 10 in map -> {10 in avl_map}")
+    print("-" * 20)
+
+    bulk = AVLMap()
+    bulk.bulk_load((k, k * k) for k in range(1, 16))
+    print(f"bulk_load of 15 keys: root {bulk.root.key}, height {bulk.root.height}")
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python avl_map.py 1000000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,9 @@
 
 import sys
 
-class AVLNode:
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
-        self.height = 1 # Height of a new node is 1
+import ordered_queries
+from tree_nodes import AVLNode # Slotted node with key, left, right, height (1) and size (1)
+from tree_nodes import subtree_size
 
 class AVLTree:
     def get_height(self, node):
@@ -38,6 +35,10 @@ class AVLTree:
         z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
 
+        # Update subtree sizes (z first, since it is now y's child)
+        z.size = 1 + subtree_size(z.left) + subtree_size(z.right)
+        y.size = 1 + subtree_size(y.left) + subtree_size(y.right)
+
         # Return the new root
         return y
 
@@ -53,6 +54,10 @@ class AVLTree:
         z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
 
+        # Update subtree sizes (z first, since it is now y's child)
+        z.size = 1 + subtree_size(z.left) + subtree_size(z.right)
+        y.size = 1 + subtree_size(y.left) + subtree_size(y.right)
+
         # Return the new root
         return y
 
@@ -65,8 +70,9 @@ class AVLTree:
         else:
             root.right = self.insert(root.right, key)
 
-        # 2. Update the height of the ancestor node
+        # 2. Update the height and size of the ancestor node
         root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
+        root.size = 1 + subtree_size(root.left) + subtree_size(root.right)
 
         # 3. Get the balance factor
         balance = self.get_balance(root)
@@ -114,8 +120,9 @@ class AVLTree:
         if root is None:
             return root
 
-        # 2. Update height
+        # 2. Update height and size
         root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
+        root.size = 1 + subtree_size(root.left) + subtree_size(root.right)
 
         # 3. Get the balance factor
         balance = self.get_balance(root)
@@ -138,6 +145,42 @@ class AVLTree:
 
         return root
         
+    # --- Order Statistics (O(log n) using subtree sizes; see ordered_queries.py) ---
+
+    def select(self, root, k):
+        """Returns the k-th smallest key (1-based), or None if k is out of range."""
+        return ordered_queries.select(root, k)
+
+    def rank(self, root, key):
+        """Returns the number of keys strictly smaller than `key`."""
+        return ordered_queries.rank(root, key)
+
+    def count_range(self, root, lo, hi):
+        """Returns the number of keys k with lo <= k <= hi."""
+        return ordered_queries.count_range(root, lo, hi)
+
+    # --- Ordered Queries (lazy, O(log n) memory; see ordered_queries.py) ---
+
+    def irange(self, root, lo=None, hi=None, reverse=False):
+        """Lazily yields the keys with lo <= key <= hi (either bound may be None)."""
+        return ordered_queries.irange(root, lo, hi, reverse)
+
+    def floor(self, root, key):
+        """Returns the largest key <= `key`, or None."""
+        return ordered_queries.floor(root, key)
+
+    def ceiling(self, root, key):
+        """Returns the smallest key >= `key`, or None."""
+        return ordered_queries.ceiling(root, key)
+
+    def successor(self, root, key):
+        """Returns the smallest key > `key`, or None."""
+        return ordered_queries.successor(root, key)
+
+    def predecessor(self, root, key):
+        """Returns the largest key < `key`, or None."""
+        return ordered_queries.predecessor(root, key)
+
     def pre_order(self, root):
         if not root:
             return []
@@ -167,5 +210,14 @@ def main():
     print(my_tree.pre_order(root))
     # Expected final tree pre-order: [30, 20, 25, 40, 50]
 
+    print("\nOrder statistics on [20, 25, 30, 40, 50]:")
+    print(f"select(2) = {my_tree.select(root, 2)}")               # 25
+    print(f"rank(40) = {my_tree.rank(root, 40)}")                  # 3
+    print(f"count_range(22, 45) = {my_tree.count_range(root, 22, 45)}")  # 3
+
+    print("\nRange queries:")
+    print(f"irange(22, 45) = {list(my_tree.irange(root, 22, 45))}")  # [25, 30, 40]
+    print(f"floor(35) = {my_tree.floor(root, 35)}, ceiling(35) = {my_tree.ceiling(root, 35)}")
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,11 +1,8 @@
 # trees/binary_search_tree.py
 
-class TreeNode:
-    """A node in a Binary Search Tree."""
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
+import ordered_queries
+from tree_nodes import SizedNode as TreeNode # Slotted node with key, left, right and size
+from tree_nodes import subtree_size
 
 class BinarySearchTree:
     """A class representing a Binary Search Tree."""
@@ -24,6 +21,7 @@ class BinarySearchTree:
         elif key > node.key:
             node.right = self._insert_recursive(node.right, key)
         # If key is equal, do nothing to avoid duplicates
+        node.size = 1 + subtree_size(node.left) + subtree_size(node.right)
         return node
 
     def search(self, key):
@@ -62,6 +60,7 @@ class BinarySearchTree:
             node.key = temp.key # Copy the successor's content to this node
             node.right = self._delete_recursive(node.right, temp.key) # Delete the successor
             
+        node.size = 1 + subtree_size(node.left) + subtree_size(node.right)
         return node
 
     def _get_min_value_node(self, node):
@@ -70,6 +69,46 @@ class BinarySearchTree:
             current = current.left
         return current
 
+    # --- Order Statistics (O(h) using subtree sizes) ---
+
+    def select(self, k):
+        """Returns the k-th smallest key (1-based), or None if k is out of range."""
+        return ordered_queries.select(self.root, k)
+
+    def rank(self, key):
+        """Returns the number of keys strictly smaller than `key`."""
+        return ordered_queries.rank(self.root, key)
+
+    def count_range(self, lo, hi):
+        """Returns the number of keys k with lo <= k <= hi."""
+        return ordered_queries.count_range(self.root, lo, hi)
+
+    # --- Ordered Queries (lazy, O(h) memory; see ordered_queries.py) ---
+
+    def __iter__(self):
+        """Lazily yields the keys in ascending order."""
+        return ordered_queries.irange(self.root)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """Lazily yields the keys with lo <= key <= hi (either bound may be None)."""
+        return ordered_queries.irange(self.root, lo, hi, reverse)
+
+    def floor(self, key):
+        """Returns the largest key <= `key`, or None."""
+        return ordered_queries.floor(self.root, key)
+
+    def ceiling(self, key):
+        """Returns the smallest key >= `key`, or None."""
+        return ordered_queries.ceiling(self.root, key)
+
+    def successor(self, key):
+        """Returns the smallest key > `key`, or None."""
+        return ordered_queries.successor(self.root, key)
+
+    def predecessor(self, key):
+        """Returns the largest key < `key`, or None."""
+        return ordered_queries.predecessor(self.root, key)
+
     def inorder_traversal(self):
         """Returns a list of keys in ascending order."""
         result = []
@@ -108,5 +147,18 @@ def main():
     print(f"New root should be 60: {bst.root.key == 60}")
     print("-" * 20)
 
+    print(f"Order statistics on {bst.inorder_traversal()}:")
+    print(f"select(3) = {bst.select(3)}")                     # 60
+    print(f"rank(70) = {bst.rank(70)}")                       # 3
+    print(f"count_range(36, 75) = {bst.count_range(36, 75)}")  # 2
+    print("-" * 20)
+
+    print("Range queries:")
+    print(f"irange(33, 75) = {list(bst.irange(33, 75))}")                 # [35, 60, 70]
+    print(f"irange(33, 75, reverse=True) = {list(bst.irange(33, 75, reverse=True))}")
+    print(f"floor(65) = {bst.floor(65)}, ceiling(65) = {bst.ceiling(65)}")  # 60, 70
+    print(f"successor(70) = {bst.successor(70)}, predecessor(30) = {bst.predecessor(30)}")
+    print("-" * 20)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,11 +1,18 @@
 # trees/binary_tree_traversals.py
 
-class TreeNode:
-    """A node in a binary tree."""
-    def __init__(self, value):
-        self.value = value
-        self.left = None
-        self.right = None
+import sys
+import time
+from collections import deque
+
+from tree_nodes import BinaryNode
+
+
+class TreeNode(BinaryNode):
+    """A node in a binary tree (a slotted `BinaryNode`; `value` is an alias for `key`)."""
+    __slots__ = ()
+
+    def __init__(self, value=0, left=None, right=None):
+        super().__init__(value, left, right)
 
 # --- Recursive Traversal Implementations ---
 
@@ -39,6 +46,272 @@ def postorder_traversal(root: TreeNode):
     postorder_traversal(root.right)
     print(root.value, end=" ")
 
+# --- Iterative Traversals (Generators) ---
+# These yield values lazily instead of printing, and never recurse, so they
+# work on trees of any depth. Their stacks hold at most one root-to-leaf path.
+
+def iter_inorder(root: TreeNode):
+    """
+    Yields values in-order (Left, Root, Right) using an explicit stack.
+
+    Time Complexity: O(n). Space Complexity: O(h).
+    """
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.value
+        node = node.right
+
+def iter_preorder(root: TreeNode):
+    """
+    Yields values in pre-order (Root, Left, Right) using an explicit stack.
+    Only right children wait on the stack, one per left turn on the path.
+
+    Time Complexity: O(n). Space Complexity: O(h).
+    """
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            node = node.left
+        node = stack.pop() if stack else None
+
+def iter_postorder(root: TreeNode):
+    """
+    Yields values in post-order (Left, Right, Root) using one explicit stack.
+    A node is emitted once its right subtree is done, which we detect by
+    remembering the last node we emitted.
+
+    Time Complexity: O(n). Space Complexity: O(h).
+    """
+    stack = []
+    node = root
+    last = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right  # Visit the right subtree first
+        else:
+            stack.pop()
+            yield top.value
+            last = top
+
+def iter_level_order(root: TreeNode):
+    """
+    Yields values level by level, left to right (breadth-first).
+
+    Time Complexity: O(n). Space Complexity: O(w) for the widest level.
+    """
+    if not root:
+        return
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node.value
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+# --- Morris Traversals (O(1) Extra Space) ---
+# Morris traversals need no stack: before descending into a left subtree,
+# they point the right pointer of that subtree's rightmost node (the
+# in-order predecessor) back at the current node, and use that temporary
+# "thread" to climb back up. Every thread is removed on the second visit.
+# If the consumer stops early (a `break`, an exception, or closing the
+# generator), a `finally` block finishes the walk without yielding, so the
+# tree is always restored once the generator ends. While a generator is
+# suspended mid-walk the tree still carries threads, so do not modify or
+# traverse it with anything else until then.
+
+def _morris_unthread(node):
+    """Finishes a Morris walk from `node` without output, removing every thread."""
+    while node:
+        if node.left is None:
+            node = node.right
+            continue
+        pred = node.left
+        while pred.right and pred.right is not node:
+            pred = pred.right
+        if pred.right is None:
+            pred.right = node
+            node = node.left
+        else:
+            pred.right = None
+            node = node.right
+
+def morris_inorder(root: TreeNode):
+    """
+    Yields values in-order with O(1) extra space.
+
+    Time Complexity: O(n); each edge is walked at most a few times.
+    Space Complexity: O(1).
+    """
+    node = root
+    try:
+        while node:
+            if node.left is None:
+                # Step past the node before yielding, so that an early exit
+                # resumes the cleanup walk from the right place.
+                value, node = node.value, node.right
+                yield value
+                continue
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node  # Thread back, then go left
+                node = node.left
+            else:
+                pred.right = None  # Left subtree done: remove the thread
+                value, node = node.value, node.right
+                yield value
+    finally:
+        _morris_unthread(node)
+
+def morris_preorder(root: TreeNode):
+    """
+    Yields values in pre-order with O(1) extra space. Same threading as
+    `morris_inorder`, but a node is emitted on its first visit.
+
+    Time Complexity: O(n). Space Complexity: O(1).
+    """
+    node = root
+    try:
+        while node:
+            if node.left is None:
+                value, node = node.value, node.right
+                yield value
+                continue
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node
+                value, node = node.value, node.left
+                yield value
+            else:
+                pred.right = None
+                node = node.right
+    finally:
+        _morris_unthread(node)
+
+def _reverse_right_path(start, end):
+    """Reverses the right pointers on the path start -> ... -> end."""
+    prev, node = None, start
+    while prev is not end:
+        node.right, prev, node = prev, node, node.right
+
+def morris_postorder(root: TreeNode):
+    """
+    Yields values in post-order with O(1) extra space.
+
+    Approach:
+    Run the in-order threading on a dummy node whose left child is the root.
+    Whenever a thread is removed at `node`, the right-hand path from
+    node.left down to the predecessor is exactly the part of the tree that
+    is now complete, and post-order emits it bottom-up. We reverse that path
+    in place, walk it, and reverse it back, so no stack is needed.
+
+    Time Complexity: O(n). Space Complexity: O(1).
+    """
+    dummy = TreeNode(None, root)
+    node = dummy
+    reversed_path = None  # (pred, node.left) while that path is reversed
+    try:
+        while node:
+            if node.left is None:
+                node = node.right
+                continue
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node
+                node = node.left
+            else:
+                pred.right = None
+                _reverse_right_path(node.left, pred)
+                reversed_path = (pred, node.left)
+                walker = pred
+                while True:
+                    yield walker.value
+                    if walker is node.left:
+                        break
+                    walker = walker.right
+                _reverse_right_path(pred, node.left)
+                reversed_path = None
+                node = node.right
+    finally:
+        if reversed_path:
+            _reverse_right_path(*reversed_path)
+            node = node.right
+        _morris_unthread(node)
+
+# --- Benchmark ---
+
+def _collect_recursive(root, out):
+    """The recursive in-order traversal, collecting into a list instead of printing."""
+    if not root:
+        return
+    _collect_recursive(root.left, out)
+    out.append(root.value)
+    _collect_recursive(root.right, out)
+
+def recursive_inorder_list(root: TreeNode):
+    out = []
+    _collect_recursive(root, out)
+    return out
+
+def build_balanced(n):
+    """Builds a complete tree of n nodes (values 0..n-1 in level order)."""
+    nodes = [TreeNode(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
+def build_degenerate(n):
+    """Builds a left-leaning chain of n nodes, like a BST fed descending keys."""
+    root = None
+    for i in range(n):
+        root = TreeNode(i, root)
+    return root
+
+def benchmark(n: int):
+    traversals = [("recursive in-order (list)", recursive_inorder_list),
+                  ("iter_inorder", iter_inorder),
+                  ("iter_preorder", iter_preorder),
+                  ("iter_postorder", iter_postorder),
+                  ("iter_level_order", iter_level_order),
+                  ("morris_inorder", morris_inorder),
+                  ("morris_preorder", morris_preorder),
+                  ("morris_postorder", morris_postorder)]
+    for shape, build in (("balanced", build_balanced), ("degenerate", build_degenerate)):
+        root = build(n)
+        print(f"--- {shape.capitalize()} tree, {n:,} nodes ---")
+        for name, traversal in traversals:
+            start = time.perf_counter()
+            try:
+                count = sum(1 for _ in traversal(root))
+            except RecursionError:
+                print(f"{name:>26}: RecursionError")
+                continue
+            print(f"{name:>26}: {time.perf_counter() - start:6.2f}s ({count:,} values)")
+        print("-" * 30)
+
 def main():
     """
     Constructs the following tree for demonstration:
@@ -77,5 +350,18 @@ def main():
     print("\nExpected: A C E D B H I G F")
     print("-" * 30)
 
+    print("--- Generator Traversals ---")
+    print(f"iter_inorder:     {' '.join(iter_inorder(root))}")
+    print(f"morris_inorder:   {' '.join(morris_inorder(root))}")
+    print(f"iter_preorder:    {' '.join(iter_preorder(root))}")
+    print(f"morris_preorder:  {' '.join(morris_preorder(root))}")
+    print(f"iter_postorder:   {' '.join(iter_postorder(root))}")
+    print(f"morris_postorder: {' '.join(morris_postorder(root))}")
+    print(f"iter_level_order: {' '.join(iter_level_order(root))}")  # F B G A D I C E H
+    print("-" * 30)
+
+    # Pass a size on the command line, e.g. `python binary_tree_traversals.py 100000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
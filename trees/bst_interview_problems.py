@@ -1,11 +1,6 @@
 # trees/bst_interview_problems.py
 
-class TreeNode:
-    """A node in a binary tree."""
-    def __init__(self, val=0, left=None, right=None):
-        self.val = val
-        self.left = left
-        self.right = right
+from tree_nodes import TreeNode # Slotted node; TreeNode(val=0, left=None, right=None)
 
 # --- Interview Problems ---
 
@@ -0,0 +1,218 @@
+# trees/lca_index.py
+
+"""
+A preprocessing index for lowest-common-ancestor, depth, distance and
+ancestor queries on any fixed binary tree (not just BSTs), with O(1)
+queries after O(n log n) preprocessing.
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from binary_search_tree import BinarySearchTree
+from bst_interview_problems import lowest_common_ancestor_bst
+from tree_nodes import BinaryNode
+
+
+class LCAIndex:
+    """
+    Answers LCA queries on a static tree in O(1) with a sparse table.
+
+    Approach:
+    1. Number the nodes in pre-order with an iterative DFS, recording each
+       node's depth, parent and subtree size. Node i's subtree is then the
+       index range [i, i + size).
+    2. For two different nodes u < v (in pre-order), walk the pre-order
+       sequence from u + 1 to v: the shallowest node in that range is the
+       child of the LCA on the way to v. (Going from u to v, the DFS must
+       climb out of u's branch and enter v's branch through exactly that
+       child.) So LCA(u, v) = parent of argmin depth over (u, v], unless u
+       is an ancestor of v, in which case it is u.
+    3. Range-minimum queries are O(1) with a sparse table: level k holds the
+       minimum of every window of length 2^k, and any range is covered by
+       two overlapping windows. Each entry packs (depth, index) into one
+       integer, depth * n + index, so a plain `min` compares depths first.
+    This variant of the Euler-tour method needs a table over n entries
+    rather than the 2n - 1 of a full Euler tour.
+
+    Time Complexity: O(n log n) to build, O(1) per query.
+    Space Complexity: O(n log n) for the table (8 bytes per entry).
+    """
+    def __init__(self, root):
+        self.nodes = []          # Pre-order index -> node
+        self._index = {}         # id(node) -> pre-order index
+        depth, parent = array('l'), array('l')
+        stack = [(root, 0, -1)] if root else []
+        while stack:
+            node, node_depth, node_parent = stack.pop()
+            self._index[id(node)] = len(self.nodes)
+            self.nodes.append(node)
+            depth.append(node_depth)
+            parent.append(node_parent)
+            i = len(self.nodes) - 1
+            if node.right:
+                stack.append((node.right, node_depth + 1, i))
+            if node.left:
+                stack.append((node.left, node_depth + 1, i))
+        n = len(self.nodes)
+        self.depth, self.parent = depth, parent
+
+        # Children follow their parent in pre-order, so one backward pass
+        # accumulates subtree sizes.
+        size = array('l', [1]) * n
+        for i in range(n - 1, 0, -1):
+            size[parent[i]] += size[i]
+        self.size = size
+
+        level = array('q', (d * n + i for i, d in enumerate(depth)))
+        self._table = [level]
+        width = 1
+        while 2 * width <= n:
+            level = array('q', map(min, level[:-width], level[width:]))
+            self._table.append(level)
+            width *= 2
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _lca(self, u, v):
+        """LCA of two pre-order indexes, as a pre-order index."""
+        if u > v:
+            u, v = v, u
+        if v < u + self.size[u]:  # v is in u's subtree (or u == v)
+            return u
+        lo = u + 1
+        k = (v - lo + 1).bit_length() - 1
+        row = self._table[k]
+        shallowest = min(row[lo], row[v - (1 << k) + 1]) % len(self.nodes)
+        return self.parent[shallowest]
+
+    def lca(self, p, q):
+        """Returns the lowest common ancestor node of nodes p and q. O(1)."""
+        return self.nodes[self._lca(self._index[id(p)], self._index[id(q)])]
+
+    def depth_of(self, node):
+        """Returns the number of edges from the root to `node`. O(1)."""
+        return self.depth[self._index[id(node)]]
+
+    def distance(self, p, q):
+        """Returns the number of edges on the path between p and q. O(1)."""
+        u, v = self._index[id(p)], self._index[id(q)]
+        depth = self.depth
+        return depth[u] + depth[v] - 2 * depth[self._lca(u, v)]
+
+    def is_ancestor(self, p, q):
+        """Returns True if p is q itself or an ancestor of q. O(1)."""
+        u, v = self._index[id(p)], self._index[id(q)]
+        return u <= v < u + self.size[u]
+
+    # --- Batched Queries ---
+    # These answer a whole list of (p, q) pairs in one loop with every
+    # lookup bound to a local name, avoiding a method call per query.
+
+    def lca_many(self, pairs):
+        """Returns the LCA node for every (p, q) pair."""
+        index, nodes, size, parent = self._index, self.nodes, self.size, self.parent
+        table, n = self._table, len(self.nodes)
+        result = []
+        for p, q in pairs:
+            u, v = index[id(p)], index[id(q)]
+            if u > v:
+                u, v = v, u
+            if v < u + size[u]:
+                result.append(nodes[u])
+                continue
+            k = (v - u).bit_length() - 1
+            row = table[k]
+            result.append(nodes[parent[min(row[u + 1], row[v - (1 << k) + 1]) % n]])
+        return result
+
+    def distance_many(self, pairs):
+        """Returns the path length for every (p, q) pair."""
+        index, depth = self._index, self.depth
+        lca = self._lca
+        result = []
+        for p, q in pairs:
+            u, v = index[id(p)], index[id(q)]
+            result.append(depth[u] + depth[v] - 2 * depth[lca(u, v)])
+        return result
+
+
+# --- Benchmark ---
+
+def build_comb(n):
+    """
+    Builds a BST of about n nodes shaped like a comb: a right-leaning spine
+    (keys 0, 2, 4, ...) where each spine node has a leaf child on its left.
+    Its height is about n / 2, so walking down from the root is slow.
+    """
+    root = None
+    for key in range(2 * (n // 2), -1, -2):
+        root = BinaryNode(key, BinaryNode(key - 1) if key else None, root)
+    return root
+
+def _time_per_query(function, pairs):
+    start = time.perf_counter()
+    result = function(pairs)
+    return result, (time.perf_counter() - start) / len(pairs) * 1e6
+
+def benchmark(n: int, queries: int = 100_000):
+    keys = list(range(n))
+    rng = random.Random(42)
+    rng.shuffle(keys)
+    tree = BinarySearchTree()
+    for key in keys:
+        tree.insert(key)
+
+    for shape, root in (("random BST", tree.root), ("comb-shaped BST", build_comb(n))):
+        start = time.perf_counter()
+        index = LCAIndex(root)
+        print(f"--- {shape}, {len(index):,} nodes ---")
+        print(f"Build LCAIndex: {time.perf_counter() - start:.2f}s")
+        pairs = [(rng.choice(index.nodes), rng.choice(index.nodes)) for _ in range(queries)]
+        # Walking from the root costs O(h), which on the comb is O(n) per
+        # query, so only time it on a sample there.
+        sample = pairs if shape == "random BST" else pairs[:200]
+        expected, walk = _time_per_query(
+            lambda ps: [lowest_common_ancestor_bst(root, p, q) for p, q in ps], sample)
+        single, one = _time_per_query(lambda ps: [index.lca(p, q) for p, q in ps], pairs)
+        batched, many = _time_per_query(index.lca_many, pairs)
+        print(f"lowest_common_ancestor_bst: {walk:8.2f} us/query")
+        print(f"LCAIndex.lca:               {one:8.2f} us/query")
+        print(f"LCAIndex.lca_many:          {many:8.2f} us/query")
+        print(f"Results agree: {expected == single[:len(sample)] and single == batched}")
+        print("-" * 20)
+
+def main():
+    """
+    Builds the following tree, which is deliberately not a BST:
+            1
+           / \\
+          2   3
+         / \\   \\
+        4   5   6
+           / \\
+          7   8
+    """
+    n7, n8 = BinaryNode(7), BinaryNode(8)
+    n5 = BinaryNode(5, n7, n8)
+    n4, n6 = BinaryNode(4), BinaryNode(6)
+    n2 = BinaryNode(2, n4, n5)
+    root = BinaryNode(1, n2, BinaryNode(3, None, n6))
+
+    index = LCAIndex(root)
+    print(f"LCA(7, 4) = {index.lca(n7, n4).key}")  # 2
+    print(f"LCA(8, 6) = {index.lca(n8, n6).key}")  # 1
+    print(f"LCA(5, 8) = {index.lca(n5, n8).key}")  # 5
+    print(f"depth(7) = {index.depth_of(n7)}, distance(7, 6) = {index.distance(n7, n6)}")  # 3, 5
+    print(f"is_ancestor(2, 8) = {index.is_ancestor(n2, n8)}")  # True
+    print(f"lca_many: {[node.key for node in index.lca_many([(n7, n8), (n4, n6)])]}")  # [5, 1]
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python lca_index.py 1000000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# trees/ordered_queries.py
+
+"""
+Ordered queries shared by every search tree in this folder. They only use
+`node.key`, `node.left` and `node.right`, so they work on `TreeNode`
+(binary_search_tree.py), `AVLNode` and `AVLMapNode` alike. None of them
+recurse, and the iterators keep only one root-to-leaf path (O(h)) in memory.
+The order statistics (`select`, `rank`, `count_range`) also need `node.size`.
+"""
+
+from tree_nodes import subtree_size
+
+
+def _push_left_spine(stack, node, lo):
+    """Pushes the path towards the smallest key >= lo (lo=None: no bound)."""
+    while node:
+        if lo is not None and node.key < lo:
+            node = node.right  # This node and its left subtree are too small
+        else:
+            stack.append(node)
+            node = node.left
+
+def _push_right_spine(stack, node, hi):
+    """Pushes the path towards the largest key <= hi (hi=None: no bound)."""
+    while node:
+        if hi is not None and node.key > hi:
+            node = node.left  # This node and its right subtree are too large
+        else:
+            stack.append(node)
+            node = node.right
+
+def iter_nodes(root, lo=None, hi=None, reverse=False):
+    """
+    Lazily yields the nodes with lo <= key <= hi in sorted order (descending
+    if `reverse`). Either bound may be None.
+
+    Approach:
+    This is the iterative in-order traversal with an explicit stack, except
+    that while descending we skip any subtree that lies entirely outside
+    the bounds, and we stop as soon as we pass the far bound. Only nodes on
+    the current path sit on the stack.
+
+    Time Complexity: O(h + m) for m yielded nodes.
+    Space Complexity: O(h).
+    """
+    stack = []
+    if not reverse:
+        _push_left_spine(stack, root, lo)
+        while stack:
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+            yield node
+            _push_left_spine(stack, node.right, None)
+    else:
+        _push_right_spine(stack, root, hi)
+        while stack:
+            node = stack.pop()
+            if lo is not None and node.key < lo:
+                return
+            yield node
+            _push_right_spine(stack, node.left, None)
+
+def irange(root, lo=None, hi=None, reverse=False):
+    """Lazily yields the keys with lo <= key <= hi in sorted order."""
+    for node in iter_nodes(root, lo, hi, reverse):
+        yield node.key
+
+def floor(root, key):
+    """Returns the largest key <= `key`, or None. O(h)."""
+    best = None
+    node = root
+    while node:
+        if node.key == key:
+            return node.key
+        if node.key < key:
+            best = node.key
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+def ceiling(root, key):
+    """Returns the smallest key >= `key`, or None. O(h)."""
+    best = None
+    node = root
+    while node:
+        if node.key == key:
+            return node.key
+        if node.key > key:
+            best = node.key
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+def successor(root, key):
+    """Returns the smallest key strictly greater than `key`, or None. O(h)."""
+    best = None
+    node = root
+    while node:
+        if node.key > key:
+            best = node.key
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+def predecessor(root, key):
+    """Returns the largest key strictly smaller than `key`, or None. O(h)."""
+    best = None
+    node = root
+    while node:
+        if node.key < key:
+            best = node.key
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+# --- Order Statistics ---
+# Every node knows the size of its subtree, so at each node we can tell how
+# many keys lie to its left without visiting them. All three queries
+# therefore follow a single root-to-leaf path: O(h), O(log n) when balanced.
+
+def select(root, k):
+    """Returns the k-th smallest key (1-based), or None if k is out of range."""
+    node = root
+    while node:
+        left_size = subtree_size(node.left)
+        if k <= left_size:
+            node = node.left
+        elif k == left_size + 1:
+            return node.key
+        else:
+            k -= left_size + 1
+            node = node.right
+    return None
+
+def _count_below(root, key, inclusive):
+    """Counts keys < key (or <= key when inclusive)."""
+    count = 0
+    node = root
+    while node:
+        if node.key < key or (inclusive and node.key == key):
+            count += subtree_size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+def rank(root, key):
+    """Returns the number of keys strictly smaller than `key`."""
+    return _count_below(root, key, inclusive=False)
+
+def count_range(root, lo, hi):
+    """Returns the number of keys k with lo <= k <= hi."""
+    if hi < lo:
+        return 0
+    return _count_below(root, hi, inclusive=True) - _count_below(root, lo, inclusive=False)
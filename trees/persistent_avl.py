@@ -0,0 +1,308 @@
+# trees/persistent_avl.py
+
+"""
+A persistent (copy-on-write) AVL map. Every insert or delete builds a new
+root that shares all untouched subtrees with the previous version, so a
+reader can keep any old root as a consistent snapshot without locking.
+"""
+
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+import ordered_queries
+from avl_map import AVLMapNode
+from tree_nodes import subtree_size
+
+
+_new_node = object.__new__
+
+def _height(node):
+    return node.height if node else 0
+
+def _make(key, value, left, right):
+    """Creates a fresh node over two existing subtrees."""
+    # Every update creates O(log n) nodes, so skip the chain of __init__
+    # calls and fill in all the slots directly.
+    node = _new_node(AVLMapNode)
+    node.key = key
+    node.value = value
+    node.left = left
+    node.right = right
+    node.height = 1 + max(_height(left), _height(right))
+    node.size = 1 + subtree_size(left) + subtree_size(right)
+    return node
+
+def _balance(key, value, left, right):
+    """
+    Like `_make`, but rotates if the heights of `left` and `right` differ by
+    two. Rotations build new nodes instead of relinking the old ones, because
+    the old ones may still be part of somebody's snapshot.
+    """
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:
+        if _height(left.left) >= _height(left.right):  # Left Left
+            return _make(left.key, left.value, left.left,
+                         _make(key, value, left.right, right))
+        mid = left.right                                # Left Right
+        return _make(mid.key, mid.value,
+                     _make(left.key, left.value, left.left, mid.left),
+                     _make(key, value, mid.right, right))
+    if hr > hl + 1:
+        if _height(right.right) >= _height(right.left):  # Right Right
+            return _make(right.key, right.value,
+                         _make(key, value, left, right.left), right.right)
+        mid = right.left                                  # Right Left
+        return _make(mid.key, mid.value,
+                     _make(key, value, left, mid.left),
+                     _make(right.key, right.value, mid.right, right.right))
+    return _make(key, value, left, right)
+
+def _rebuild(path, subtree):
+    """
+    Copies the search path bottom-up on top of a new `subtree`. `path` holds
+    (node, went_left) pairs from the root down.
+    """
+    for node, went_left in reversed(path):
+        if went_left:
+            subtree = _balance(node.key, node.value, subtree, node.right)
+        else:
+            subtree = _balance(node.key, node.value, node.left, subtree)
+    return subtree
+
+def insert(root, key, value=None):
+    """
+    Returns a new root with `key` mapped to `value`; `root` is not modified.
+
+    Time Complexity: O(log n). Space Complexity: O(log n) new nodes.
+    """
+    path = []
+    node = root
+    while node:
+        if key == node.key:
+            return _rebuild(path, _make(key, value, node.left, node.right))
+        went_left = key < node.key
+        path.append((node, went_left))
+        node = node.left if went_left else node.right
+    return _rebuild(path, _make(key, value, None, None))
+
+def _without_min(node):
+    """Returns (min node, copy of `node`'s subtree without it)."""
+    path = []
+    while node.left:
+        path.append((node, True))
+        node = node.left
+    return node, _rebuild(path, node.right)
+
+def delete(root, key):
+    """
+    Returns a new root without `key` (or `root` itself if the key is absent);
+    `root` is not modified.
+
+    Time Complexity: O(log n). Space Complexity: O(log n) new nodes.
+    """
+    path = []
+    node = root
+    while node and node.key != key:
+        went_left = key < node.key
+        path.append((node, went_left))
+        node = node.left if went_left else node.right
+    if node is None:
+        return root
+    if node.left is None or node.right is None:
+        replacement = node.left or node.right
+    else:
+        successor, right = _without_min(node.right)
+        replacement = _balance(successor.key, successor.value, node.left, right)
+    return _rebuild(path, replacement)
+
+
+class Snapshot:
+    """
+    A read-only view of one version of a `PersistentAVLMap`. Taking one costs
+    O(1): it just holds the root. Nothing ever mutates the nodes beneath it,
+    so it can be read from any thread without a lock.
+    """
+    __slots__ = ("root",)
+
+    def __init__(self, root):
+        self.root = root
+
+    def __len__(self):
+        return subtree_size(self.root)
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key`, or `default`."""
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                return node.value
+        return default
+
+    def __contains__(self, key):
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __iter__(self):
+        """Lazily yields the keys in ascending order."""
+        return ordered_queries.irange(self.root)
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """Lazily yields (key, value) pairs with lo <= key <= hi in key order."""
+        for node in ordered_queries.iter_nodes(self.root, lo, hi, reverse):
+            yield node.key, node.value
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """Lazily yields the keys with lo <= key <= hi (either bound may be None)."""
+        return ordered_queries.irange(self.root, lo, hi, reverse)
+
+    def floor(self, key):
+        """Returns the largest key <= `key`, or None."""
+        return ordered_queries.floor(self.root, key)
+
+    def ceiling(self, key):
+        """Returns the smallest key >= `key`, or None."""
+        return ordered_queries.ceiling(self.root, key)
+
+    def select(self, k):
+        """Returns the k-th smallest key (1-based), or None. O(log n)."""
+        return ordered_queries.select(self.root, k)
+
+    def rank(self, key):
+        """Returns the number of keys strictly smaller than `key`. O(log n)."""
+        return ordered_queries.rank(self.root, key)
+
+
+class PersistentAVLMap(Snapshot):
+    """
+    A sorted map whose updates never modify existing nodes.
+
+    Approach (path copying):
+    An insert or delete walks from the root to the affected position, then
+    rebuilds only the nodes on that path, bottom-up, with new children
+    pointers. Every subtree that was not on the path is shared with the
+    previous version. Rebalancing rotations likewise create new nodes. The
+    old root therefore still describes the old tree exactly.
+
+    - Writers are serialized by a lock and publish a new version by a single
+      assignment to `self.root`, which is atomic in CPython.
+    - Readers call `snapshot()` (or read `self.root`) and then work on that
+      version for as long as they like, with no locking at all.
+
+    Time Complexity: O(log n) for every operation; snapshot() is O(1).
+    Space Complexity: O(log n) new nodes per update; old versions are freed
+    once no snapshot refers to them.
+    """
+    __slots__ = ("_write_lock",)
+
+    def __init__(self, items=()):
+        super().__init__(None)
+        self._write_lock = threading.Lock()
+        for key, value in items:
+            self.insert(key, value)
+
+    def insert(self, key, value=None):
+        """Inserts a key, or updates its value, as a new version."""
+        with self._write_lock:
+            self.root = insert(self.root, key, value)
+
+    def delete(self, key) -> bool:
+        """Deletes a key as a new version. Returns True if it was present."""
+        with self._write_lock:
+            new_root = delete(self.root, key)
+            changed = new_root is not self.root
+            self.root = new_root
+            return changed
+
+    def snapshot(self):
+        """Returns a read-only view of the current version. O(1)."""
+        return Snapshot(self.root)
+
+
+# --- Demonstration and Benchmark ---
+
+def count_shared_nodes(a, b):
+    """Counts the nodes of version `b` that are also nodes of version `a`."""
+    seen = {id(node) for node in ordered_queries.iter_nodes(a)}
+    return sum(1 for node in ordered_queries.iter_nodes(b) if id(node) in seen)
+
+def concurrent_readers(n: int, readers: int = 4):
+    """Readers scan snapshots while a writer keeps inserting; no reader locks."""
+    index = PersistentAVLMap((key, key) for key in range(0, 2 * n, 2))
+    stop = threading.Event()
+    errors = []
+
+    def reader():
+        while not stop.is_set():
+            snap = index.snapshot()
+            keys = list(snap)
+            if len(keys) != len(snap) or keys != sorted(keys):
+                errors.append("inconsistent snapshot")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for key in range(1, 2 * n, 2):
+        index.insert(key, key)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"{n:,} inserts with {readers} concurrent readers in {elapsed:.2f}s, "
+          f"inconsistent snapshots seen: {len(errors)}")
+
+def benchmark(n: int, versions: int = 1_000):
+    keys = list(range(n))
+    random.Random(42).shuffle(keys)
+    index = PersistentAVLMap()
+    start = time.perf_counter()
+    for key in keys:
+        index.insert(key, key)
+    print(f"--- Benchmark ({n:,} keys) ---")
+    print(f"Build by {n:,} persistent inserts: {time.perf_counter() - start:.2f}s")
+
+    # Keep `versions` snapshots alive, one after every further update.
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    snapshots = []
+    for key in range(n, n + versions):
+        snapshots.append(index.snapshot())
+        index.insert(key, key)
+    per_version = (tracemalloc.get_traced_memory()[0] - before) / versions
+    tracemalloc.stop()
+
+    node_bytes = sys.getsizeof(AVLMapNode(0))
+    print(f"Memory per retained snapshot: {per_version:,.0f} bytes "
+          f"(a full copy would be about {n * node_bytes:,} bytes)")
+    shared = count_shared_nodes(snapshots[-1].root, index.root)
+    print(f"Nodes shared by the last two versions: {shared:,} of {len(index):,}")
+    print("-" * 20)
+    concurrent_readers(min(n, 20_000))
+    print("-" * 20)
+
+def main():
+    index = PersistentAVLMap()
+    for key in [10, 20, 30, 40, 50, 25]:
+        index.insert(key, f"v{key}")
+    before = index.snapshot()
+    index.delete(10)
+    index.insert(35, "v35")
+    print(f"Snapshot before updates: {list(before.items())}")
+    print(f"Current version:         {list(index.items())}")
+    print(f"Nodes shared between them: {count_shared_nodes(before.root, index.root)} "
+          f"of {len(index)}")
+    print(f"Snapshot: select(1) = {before.select(1)}, current: select(1) = {index.select(1)}")
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python persistent_avl.py 1000000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# trees/sorted_chunk_map.py
+
+"""
+A cache-friendly ordered map stored as a sorted list of sorted chunks
+(a flattened B+ tree with fan-out `load`), with the same API as
+`BinarySearchTree` and a benchmark against the pointer-based trees.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left, bisect_right
+
+from avl_tree import AVLTree
+from binary_search_tree import BinarySearchTree
+
+
+class SortedChunkMap:
+    """
+    An ordered map that keeps its keys in a list of sorted Python lists.
+
+    Approach:
+    Keys live in `chunks`, a list of sorted lists of between about load/2 and
+    2*load keys; values live in parallel lists in `value_chunks`. A separate
+    list `maxes` holds the largest key of every chunk. Finding a key takes
+    two binary searches: `bisect` on `maxes` picks the chunk, then `bisect`
+    inside the chunk finds the position. Each chunk is a contiguous array of
+    pointers, so there is no per-key node object and a lookup touches two
+    small arrays instead of one object per tree level.
+
+    - Insert puts the key into its chunk; a chunk that grows past 2 * load
+      is split in half.
+    - Delete removes the key; a chunk that shrinks below load / 2 is merged
+      with a neighbour (and split again if that makes it too large).
+
+    Time Complexity: O(log n) comparisons for search; insert and delete also
+    shift up to O(load) pointers inside one chunk, which is a fast memmove.
+    Space Complexity: O(n), roughly two pointers per key.
+    """
+    def __init__(self, load: int = 1000):
+        self.load = load
+        self.chunks = []
+        self.value_chunks = []
+        self.maxes = []
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _locate(self, key):
+        """Returns (chunk index, position in chunk) where `key` is or would go."""
+        i = bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            i -= 1  # Larger than everything: goes at the end of the last chunk
+        return i, bisect_left(self.chunks[i], key)
+
+    def insert(self, key, value=None):
+        """Inserts a key, or updates its value if it is already present."""
+        if not self.chunks:
+            self.chunks.append([key])
+            self.value_chunks.append([value])
+            self.maxes.append(key)
+            self.size = 1
+            return
+        i, j = self._locate(key)
+        chunk = self.chunks[i]
+        if j < len(chunk) and chunk[j] == key:
+            self.value_chunks[i][j] = value
+            return
+        chunk.insert(j, key)
+        self.value_chunks[i].insert(j, value)
+        self.maxes[i] = chunk[-1]
+        self.size += 1
+        if len(chunk) > 2 * self.load:
+            self._split(i)
+
+    def _split(self, i):
+        chunk, values = self.chunks[i], self.value_chunks[i]
+        half = len(chunk) // 2
+        self.chunks[i:i + 1] = [chunk[:half], chunk[half:]]
+        self.value_chunks[i:i + 1] = [values[:half], values[half:]]
+        self.maxes[i:i + 1] = [chunk[half - 1], chunk[-1]]
+
+    def _find(self, key):
+        if not self.chunks:
+            return None
+        i, j = self._locate(key)
+        chunk = self.chunks[i]
+        if j < len(chunk) and chunk[j] == key:
+            return i, j
+        return None
+
+    def search(self, key):
+        """Returns True if the key is present."""
+        return self._find(key) is not None
+
+    __contains__ = search
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key`, or `default`."""
+        found = self._find(key)
+        if found is None:
+            return default
+        i, j = found
+        return self.value_chunks[i][j]
+
+    def delete(self, key):
+        """Deletes a key. Returns True if it was present."""
+        found = self._find(key)
+        if found is None:
+            return False
+        i, j = found
+        chunk = self.chunks[i]
+        del chunk[j]
+        del self.value_chunks[i][j]
+        self.size -= 1
+        if not chunk:
+            del self.chunks[i], self.value_chunks[i], self.maxes[i]
+            return True
+        self.maxes[i] = chunk[-1]
+        if len(chunk) < self.load // 2 and len(self.chunks) > 1:
+            self._merge(i)
+        return True
+
+    def _merge(self, i):
+        """Merges chunk i with its right neighbour (or its left one if it is last)."""
+        if i == len(self.chunks) - 1:
+            i -= 1
+        self.chunks[i] += self.chunks[i + 1]
+        self.value_chunks[i] += self.value_chunks[i + 1]
+        self.maxes[i] = self.maxes[i + 1]
+        del self.chunks[i + 1], self.value_chunks[i + 1], self.maxes[i + 1]
+        if len(self.chunks[i]) > 2 * self.load:
+            self._split(i)
+
+    def irange(self, lo=None, hi=None, reverse=False):
+        """Lazily yields the keys with lo <= key <= hi (either bound may be None)."""
+        if not self.chunks:
+            return
+        start_i = 0 if lo is None else bisect_left(self.maxes, lo)
+        end_i = len(self.chunks) - 1 if hi is None else min(
+            bisect_left(self.maxes, hi), len(self.chunks) - 1)
+        if start_i > end_i:
+            return
+        chunk_indexes = range(start_i, end_i + 1)
+        for i in (reversed(chunk_indexes) if reverse else chunk_indexes):
+            chunk = self.chunks[i]
+            a = bisect_left(chunk, lo) if lo is not None and i == start_i else 0
+            b = bisect_right(chunk, hi) if hi is not None and i == end_i else len(chunk)
+            if reverse:
+                for j in range(b - 1, a - 1, -1):
+                    yield chunk[j]
+            else:
+                yield from chunk[a:b]
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+    def inorder_traversal(self):
+        """Returns a list of keys in ascending order."""
+        return [key for chunk in self.chunks for key in chunk]
+
+
+# --- Benchmark ---
+
+class _AVLAdapter:
+    """Gives the functional `AVLTree` API an insert/search interface."""
+    def __init__(self):
+        self.tree = AVLTree()
+        self.root = None
+
+    def insert(self, key):
+        self.root = self.tree.insert(self.root, key)
+
+    def search(self, key):
+        node = self.root
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node is not None
+
+def benchmark(n: int):
+    keys = list(range(n))
+    random.Random(42).shuffle(keys)
+    lookups = keys[: n // 2] + [-k - 1 for k in range(n // 2)]  # Half hits, half misses
+
+    print(f"--- Benchmark ({n:,} random keys) ---")
+    for name, factory in (("BinarySearchTree", BinarySearchTree),
+                          ("AVLTree", _AVLAdapter),
+                          ("SortedChunkMap", SortedChunkMap)):
+        tracemalloc.start()
+        structure = factory()
+        for key in keys:
+            structure.insert(key)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Time a second build without tracemalloc, which slows allocations.
+        start = time.perf_counter()
+        structure = factory()
+        for key in keys:
+            structure.insert(key)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in lookups:
+            structure.search(key)
+        lookup_time = time.perf_counter() - start
+        print(f"{name:>16}: {memory / n:6.1f} bytes/key, "
+              f"insert {n / insert_time:10,.0f} keys/s, "
+              f"lookup {len(lookups) / lookup_time:10,.0f} keys/s")
+    print("-" * 20)
+
+def main():
+    m = SortedChunkMap(load=4)
+    for key in [50, 30, 70, 20, 40, 60, 80, 10, 90, 35]:
+        m.insert(key, str(key))
+    print(f"Chunks (load 4): {m.chunks}")
+    print(f"In-order traversal: {m.inorder_traversal()}")
+    print(f"Search 40: {m.search(40)}, search 45: {m.search(45)}, get(60): {m.get(60)}")
+    print(f"irange(30, 70) = {list(m.irange(30, 70))}")
+    print(f"irange(30, 70, reverse=True) = {list(m.irange(30, 70, reverse=True))}")
+    for key in (20, 30, 35):
+        m.delete(key)
+    print(f"After deleting 20, 30, 35: {m.chunks}")
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python sorted_chunk_map.py 10000000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# trees/tree_nodes.py
+
+"""
+One family of compact binary tree nodes shared by every tree module.
+
+Each class declares `__slots__`, so instances store their fields in fixed
+positions instead of a per-instance `__dict__`. That removes the dictionary
+(roughly 100+ bytes per node) and makes attribute access a direct offset
+lookup. All nodes store their payload in `key`; `val` and `value` are
+aliases so code written against either naming convention (LeetCode-style
+`node.val`, or `node.value` as in binary_tree_traversals.py) keeps working.
+`TreeNode` also accepts `val=` in its constructor.
+"""
+
+import sys
+import tracemalloc
+
+
+class BinaryNode:
+    """A plain binary tree node: key, left, right."""
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, key=0, left=None, right=None):
+        self.key = key
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.key!r})"
+
+
+# Aliases for the other names used for a node's payload in this repo. They
+# are the `key` slot descriptor itself, so `node.val` reads the same slot as
+# `node.key` at the same speed, without a property call.
+BinaryNode.val = BinaryNode.value = BinaryNode.key
+
+
+class TreeNode(BinaryNode):
+    """A `BinaryNode` built LeetCode-style: TreeNode(val=0, left=None, right=None)."""
+    __slots__ = ()
+
+    def __init__(self, val=0, left=None, right=None):
+        super().__init__(val, left, right)
+
+
+def subtree_size(node):
+    """The `size` of a sized node, 0 for an empty subtree."""
+    return node.size if node else 0
+
+def _height(node):
+    return node.height if node else 0
+
+
+class SizedNode(BinaryNode):
+    """A node that also knows the size of its subtree (for order statistics)."""
+    __slots__ = ("size",)
+
+    def __init__(self, key=0, left=None, right=None):
+        super().__init__(key, left, right)
+        self.size = 1 + subtree_size(left) + subtree_size(right)
+
+
+class AVLNode(SizedNode):
+    """A node with a subtree size and a height, as used by AVL trees."""
+    __slots__ = ("height",)
+
+    def __init__(self, key=0, left=None, right=None):
+        super().__init__(key, left, right)
+        self.height = 1 + max(_height(left), _height(right))
+
+
+class ParentNode(BinaryNode):
+    """A node with a pointer back to its parent, for upward walks."""
+    __slots__ = ("parent",)
+
+    def __init__(self, key=0, left=None, right=None, parent=None):
+        super().__init__(key, left, right)
+        self.parent = parent
+        if left:
+            left.parent = self
+        if right:
+            right.parent = self
+
+
+# --- Memory Benchmark ---
+
+class DictNode:
+    """The pre-slots layout (one `__dict__` per node), kept for comparison."""
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+def build_balanced(node_class, n):
+    """Builds a balanced tree of n nodes level by level, without recursion."""
+    nodes = [node_class(i) for i in range(n)]
+    for i in range(n):
+        left, right = 2 * i + 1, 2 * i + 2
+        if left < n:
+            nodes[i].left = nodes[left]
+        if right < n:
+            nodes[i].right = nodes[right]
+    return nodes[0] if nodes else None
+
+def bytes_per_node(node_class, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    root = build_balanced(node_class, n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del root
+    return (after - before) / n
+
+def main():
+    node = AVLNode(2, AVLNode(1), AVLNode(3))
+    print(f"{node}: height {node.height}, size {node.size}, val alias {node.val}")
+    try:
+        node.color = "red"
+    except AttributeError:
+        print("Slotted nodes reject undeclared attributes such as `color`.")
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python tree_nodes.py 100000`.
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"--- Memory for {n:,} nodes (including int keys) ---")
+    print(f"DictNode (key, left, right, height, size): {bytes_per_node(DictNode, n):6.1f} bytes/node")
+    print(f"AVLNode  (same fields, __slots__):         {bytes_per_node(AVLNode, n):6.1f} bytes/node")
+    print(f"BinaryNode (key, left, right, __slots__):  {bytes_per_node(BinaryNode, n):6.1f} bytes/node")
+    print("-" * 20)
+
+if __name__ == "__main__":
+    main()
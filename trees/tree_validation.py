@@ -0,0 +1,277 @@
+# trees/tree_validation.py
+
+"""
+Bulk validation and statistics for large binary search trees, spread over
+a process pool.
+
+Trees are handled in a flat pre-order layout: `keys[i]` is the key of node
+i, and `left[i]` / `right[i]` are the indexes of its children (-1 for
+none). In pre-order every subtree occupies one contiguous slice of the
+arrays, so a subtree can be shipped to a worker process as three slices.
+"""
+
+import heapq
+import os
+import sys
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from bst_interview_problems import is_valid_bst
+from tree_nodes import BinaryNode
+
+
+class TreeStats:
+    """The result of `validate`: BST validity plus shape statistics."""
+    __slots__ = ("valid", "size", "height", "balance_histogram", "min_key", "max_key")
+
+    def __init__(self, valid, size, height, balance_histogram, min_key, max_key):
+        self.valid = valid
+        self.size = size
+        self.height = height
+        # Maps a balance factor (left height - right height) to a node count.
+        self.balance_histogram = balance_histogram
+        self.min_key = min_key
+        self.max_key = max_key
+
+    @property
+    def is_avl_balanced(self):
+        return all(abs(factor) <= 1 for factor in self.balance_histogram)
+
+    def __repr__(self):
+        histogram = dict(sorted(self.balance_histogram.items()))
+        return (f"TreeStats(valid={self.valid}, size={self.size}, height={self.height}, "
+                f"balance_histogram={histogram}, min_key={self.min_key!r}, "
+                f"max_key={self.max_key!r})")
+
+
+# --- Flat Layout ---
+
+def flatten(root):
+    """
+    Converts a node tree into the pre-order arrays (keys, left, right),
+    iteratively, so any depth works.
+    """
+    keys, left, right = [], array('l'), array('l')
+    stack = [(root, -1, False)] if root else []  # (node, parent index, is right child)
+    while stack:
+        node, parent, is_right = stack.pop()
+        i = len(keys)
+        keys.append(node.key)
+        left.append(-1)
+        right.append(-1)
+        if parent >= 0:
+            (right if is_right else left)[parent] = i
+        # Push the right child first so the left subtree is laid out first.
+        if node.right:
+            stack.append((node.right, i, True))
+        if node.left:
+            stack.append((node.left, i, False))
+    return keys, left, right
+
+
+# --- Work Done by Each Process ---
+
+def scan_subtree(keys, left, right, base=0, low=-float('inf'), high=float('inf')):
+    """
+    Validates and measures one subtree given as pre-order slices whose child
+    indexes are offset by `base`. Every key must lie strictly between `low`
+    and `high`, the bounds inherited from the subtree's ancestors.
+
+    Approach:
+    - A forward sweep pushes each node's (low, high) bounds down to its
+      children, exactly like the recursion in `is_valid_bst`; parents come
+      before children in pre-order, so one pass suffices.
+    - A backward sweep visits children before parents, so each node's
+      height follows from its children's heights, again in one pass.
+    Neither pass recurses or needs a stack.
+
+    Returns (valid, size, height, balance histogram, min key, max key).
+    Time Complexity: O(n). Space Complexity: O(n) for the bound and height arrays.
+    """
+    n = len(keys)
+    if n == 0:
+        return True, 0, 0, Counter(), None, None
+    lows, highs = [low] * n, [high] * n
+    valid = True
+    for i, key, left_child, right_child in zip(range(n), keys, left, right):
+        if not (lows[i] < key < highs[i]):
+            valid = False
+            break
+        if left_child >= 0:
+            lows[left_child - base] = lows[i]
+            highs[left_child - base] = key
+        if right_child >= 0:
+            lows[right_child - base] = key
+            highs[right_child - base] = highs[i]
+
+    # Index n holds a height of 0, so a missing child (-1 - base, mapped
+    # below to n) needs no special case.
+    heights = [0] * (n + 1)
+    balances = [0] * n
+    for i in range(n - 1, -1, -1):
+        left_child, right_child = left[i] - base, right[i] - base
+        left_height = heights[left_child if left_child >= 0 else n]
+        right_height = heights[right_child if right_child >= 0 else n]
+        heights[i] = 1 + (left_height if left_height > right_height else right_height)
+        balances[i] = left_height - right_height
+    histogram = Counter(balances)
+    return valid, n, heights[0], histogram, min(keys), max(keys)
+
+def _scan_task(task):
+    return scan_subtree(*task)
+
+
+# --- Splitting and Merging ---
+
+def _split(keys, left, right, parts, min_part):
+    """
+    Cuts the tree into at most about `parts` disjoint subtrees.
+
+    Starting from the whole tree, the largest remaining subtree is replaced
+    by its two children until there are enough pieces. The nodes removed
+    this way (the "top" of the tree) are returned separately, in the order
+    they were split, together with the (low, high) bounds of each piece.
+    """
+    n = len(keys)
+    top = []     # (index, end, low, high), parents before children
+    pieces = []  # Subtrees too small to split further
+    # Max-heap (by size) of the subtrees still to be processed: (-size, index, end, low, high)
+    heap = [(-n, 0, n, -float('inf'), float('inf'))]
+    while heap and len(heap) + len(pieces) < parts:
+        negative_size, i, end, low, high = heapq.heappop(heap)
+        if -negative_size < min_part:
+            pieces.append((negative_size, i, end, low, high))
+            continue
+        top.append((i, end, low, high))
+        key = keys[i]
+        left_end = right[i] if right[i] >= 0 else end
+        if left[i] >= 0:
+            heapq.heappush(heap, (left[i] - left_end, left[i], left_end, low, key))
+        if right[i] >= 0:
+            heapq.heappush(heap, (right[i] - end, right[i], end, key, high))
+    pieces.extend(heap)
+    return top, [(i, end, low, high) for _, i, end, low, high in pieces]
+
+def validate(keys, left, right, workers=None, serial_threshold=200_000):
+    """
+    Validates a tree in the flat pre-order layout and collects its
+    statistics, checking disjoint subtrees in parallel.
+
+    Approach:
+    1. Split the tree into about 4 pieces per worker, recording each piece's
+       inherited (low, high) bounds. A piece is valid on its own exactly
+       when its keys respect those bounds, so pieces can be checked
+       independently.
+    2. Scan the pieces across a process pool.
+    3. In this process, check the few "top" nodes above the pieces and fold
+       the results together bottom-up: heights combine as 1 + max, sizes and
+       histograms add up.
+    Trees smaller than `serial_threshold` (or workers=1) are scanned
+    serially, since starting processes and pickling slices would cost more
+    than it saves.
+
+    Time Complexity: O(n / workers) per worker plus O(pieces) to merge.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(keys)
+    if workers == 1 or n < serial_threshold:
+        return TreeStats(*scan_subtree(keys, left, right))
+
+    top, pieces = _split(keys, left, right, parts=4 * workers, min_part=1_000)
+    tasks = [(keys[i:end], left[i:end], right[i:end], i, low, high)
+             for i, end, low, high in pieces]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_scan_task, tasks))
+
+    valid = all(result[0] for result in results)
+    histogram = Counter()
+    heights = {}
+    for (i, _, _, _), result in zip(pieces, results):
+        heights[i] = result[2]
+        histogram.update(result[3])
+    for i, _, low, high in reversed(top):  # Children before parents
+        if not (low < keys[i] < high):
+            valid = False
+        left_height = heights.get(left[i], 0)
+        right_height = heights.get(right[i], 0)
+        heights[i] = 1 + max(left_height, right_height)
+        histogram[left_height - right_height] += 1
+    top_keys = [keys[i] for i, _, _, _ in top]
+    min_key = min([result[4] for result in results] + top_keys)
+    max_key = max([result[5] for result in results] + top_keys)
+    return TreeStats(valid, n, heights[0], histogram, min_key, max_key)
+
+def validate_tree(root, workers=None, serial_threshold=200_000):
+    """Convenience wrapper: flattens a node tree, then calls `validate`."""
+    return validate(*flatten(root), workers=workers, serial_threshold=serial_threshold)
+
+
+# --- Benchmark ---
+
+def balanced_arrays(n):
+    """Builds the pre-order arrays of a balanced BST on keys 0..n-1 directly."""
+    keys, left, right = [], array('l', [-1]) * n, array('l', [-1]) * n
+    stack = [(0, n - 1, -1, False)] if n else []
+    while stack:
+        lo, hi, parent, is_right = stack.pop()
+        mid = (lo + hi) // 2
+        i = len(keys)
+        keys.append(mid)
+        if parent >= 0:
+            (right if is_right else left)[parent] = i
+        if mid < hi:
+            stack.append((mid + 1, hi, i, True))
+        if lo < mid:
+            stack.append((lo, mid - 1, i, False))
+    return keys, left, right
+
+def build_nodes(keys, left, right):
+    """Builds `BinaryNode` objects from the pre-order arrays."""
+    nodes = [BinaryNode(key) for key in keys]
+    for i, node in enumerate(nodes):
+        if left[i] >= 0:
+            node.left = nodes[left[i]]
+        if right[i] >= 0:
+            node.right = nodes[right[i]]
+    return nodes[0] if nodes else None
+
+def benchmark(n: int):
+    keys, left, right = balanced_arrays(n)
+    root = build_nodes(keys, left, right)
+    workers = os.cpu_count() or 1
+    print(f"--- Benchmark ({n:,}-node balanced BST, {workers} CPU(s)) ---")
+
+    start = time.perf_counter()
+    is_valid_bst(root)
+    print(f"is_valid_bst (recursive, nodes):   {time.perf_counter() - start:6.2f}s")
+
+    start = time.perf_counter()
+    validate(keys, left, right, workers=1)
+    print(f"validate, serial (flat arrays):    {time.perf_counter() - start:6.2f}s")
+
+    start = time.perf_counter()
+    stats = validate(keys, left, right, workers=max(workers, 2), serial_threshold=0)
+    print(f"validate, {max(workers, 2)} processes:              "
+          f"{time.perf_counter() - start:6.2f}s")
+    print(stats)
+    print("-" * 20)
+
+def main():
+    valid = BinaryNode(4, BinaryNode(2, BinaryNode(1), BinaryNode(3)), BinaryNode(6, None, BinaryNode(7)))
+    print(f"Tree [4,2,6,1,3,null,7]: {validate_tree(valid)}")
+    invalid = BinaryNode(5, BinaryNode(1), BinaryNode(4, BinaryNode(3), BinaryNode(6)))
+    print(f"Tree [5,1,4,null,null,3,6]: {validate_tree(invalid)}")
+
+    keys, left, right = balanced_arrays(50_000)
+    keys[30_000] = -1  # Corrupt one key deep in the right half
+    stats = validate(keys, left, right, workers=2, serial_threshold=0)
+    print(f"50,000 nodes with one corrupted key, 2 processes: valid={stats.valid}")
+    print("-" * 20)
+
+    # Pass a size on the command line, e.g. `python tree_validation.py 10000000`.
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
+
+if __name__ == "__main__":
+    main()